@@ -0,0 +1,97 @@
+"""
+algorithms
+
+Shared algorithm implementations for the course scripts, behind a lazy registry.
+
+Importing the package only builds the tables below; an engine's module is imported the first
+time that engine is looked up, and any heavy dependency it needs (NumPy, matplotlib, ...)
+is imported by that module alone. This keeps the cold start of short CLI runs and of
+spawned worker processes to a few milliseconds.
+
+    from algorithms import SORTING_ALGORITHMS, RECORD_SORTS
+
+    SORTING_ALGORITHMS["Merge Sort"](values)          # imports algorithms.sorting now
+    RECORD_SORTS["Merge Sort"](records, key="dob")    # imports algorithms.record_sorting now
+
+New engines are added with register() instead of importing them here.
+Submodules (algorithms.sorting, algorithms.complexity_experiment, ...) are also loaded
+on first attribute access.
+"""
+
+from collections.abc import Mapping
+from importlib import import_module
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only name -> function mapping whose functions are imported on first lookup.
+
+    Entries are "module:function" paths relative to this package. Iterating, len() and
+    membership tests never import anything.
+    """
+
+    def __init__(self, entries):
+        self._entries = dict(entries)
+        self._loaded = {}
+
+    def register(self, name, path):
+        """Add (or replace) an engine given as a "module:function" path."""
+        self._entries[name] = path
+        self._loaded.pop(name, None)
+
+    def __getitem__(self, name):
+        function = self._loaded.get(name)
+        if function is None:
+            module_name, _, function_name = self._entries[name].partition(":")
+            module = import_module(f"{__name__}.{module_name}")
+            function = self._loaded[name] = getattr(module, function_name)
+        return function
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._entries)})"
+
+
+# Engines that sort a plain sequence of comparable values
+SORTING_ALGORITHMS = LazyRegistry({
+    "Bubble Sort": "sorting:bubble_sort",
+    "Merge Sort": "sorting:merge_sort",
+    "Quick Sort": "sorting:quick_sort",
+    "Insertion Sort": "sorting:insertion_sort",
+    "Heap Sort": "sorting:heap_sort",
+    "Radix Sort": "sorting:radix_sort",
+    "Counting Sort": "sorting:counting_sort",
+    "Natural Merge Sort": "sorting:natural_merge_sort",
+    "Intro Sort": "sorting:intro_sort",
+})
+
+# Engines that sort records (dicts) by one field: sort_function(records, key)
+RECORD_SORTS = LazyRegistry({
+    "Bubble Sort": "record_sorting:bubble_sort",
+    "Merge Sort": "record_sorting:merge_sort",
+})
+
+
+def register(name, path, registry=SORTING_ALGORITHMS):
+    """Add an engine to a registry (the value sorts by default)."""
+    registry.register(name, path)
+
+
+def __getattr__(name):
+    # Lazy submodule access: algorithms.sorting imports algorithms/sorting.py on first use
+    if name.startswith("_"):
+        raise AttributeError(name)
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -6,12 +6,35 @@ This isn't a strict lab exercise, but by printing timestamps or using Python's t
 It will reinforce the concept of linear vs quadratic time in a tangible way. (For instance, summing with one loop is O(n); 
 summing with two nested loops is O(n²) 
 - you’ll notice the nested version slows down much faster as n grows.)
+
+Each workload is registered with up to three variants that must agree on every n:
+- reference:   the plain Python loops, which show the asymptotic growth
+- vectorized:  the same work pushed into C with sum(range()) (same complexity, smaller constant)
+- closed_form: an O(1) formula
+The experiment verifies the fast variants against the reference and reports their speedups.
+New workloads are added with register_workload() instead of editing the engine.
 '''
 
 
 import time
 
 
+WORKLOADS = {}
+
+VARIANTS = ("reference", "vectorized", "closed_form")
+
+
+def register_workload(name, complexity, reference, vectorized=None, closed_form=None):
+    """Add a workload (and its optional fast variants) to the experiment."""
+    WORKLOADS[name] = {
+        "complexity": complexity,
+        "variants": {
+            "reference": reference,
+            "vectorized": vectorized,
+            "closed_form": closed_form,
+        },
+    }
+
 
 def linear_sum(n):
     total = 0
@@ -22,6 +45,16 @@ def linear_sum(n):
     return total
 
 
+def linear_sum_vectorized(n):
+    return sum(range(1, n + 1))
+
+
+def linear_sum_closed_form(n):
+    # 1 + 2 + ... + n (the loop runs zero times for negative n)
+    n = max(n, 0)
+    return n * (n + 1) // 2
+
+
 def nested_sum(n):
     total = 0
 
@@ -32,12 +65,64 @@ def nested_sum(n):
     return total
 
 
-def algorithm_time(func, n):
+def nested_sum_vectorized(n):
+    # the inner loop runs in C, the outer one is still n iterations
+    return sum(sum(range(1, value)) for value in range(1, n + 1))
+
+
+def nested_sum_closed_form(n):
+    # sum over value of value * (value - 1) / 2  =  (n - 1) * n * (n + 1) / 6
+    n = max(n, 0)
+    return (n - 1) * n * (n + 1) // 6
+
+
+register_workload("Linear Sum", "O(n)", linear_sum, linear_sum_vectorized, linear_sum_closed_form)
+register_workload("Nested Sum", "O(n²)", nested_sum, nested_sum_vectorized, nested_sum_closed_form)
+
+
+def timed_run(func, n):
+    """Run func(n) once and return (elapsed seconds, result)."""
     start_time = time.perf_counter()
-    func(n)
+    result = func(n)
     end_time = time.perf_counter()
-    
-    return end_time - start_time
+
+    return end_time - start_time, result
+
+
+def verify_workloads(sizes=(-3, 0, 1, 2, 3, 10, 57, 100)):
+    """Check every fast variant against its reference on small n; raise ValueError on a mismatch."""
+    for name, workload in WORKLOADS.items():
+        reference = workload["variants"]["reference"]
+        for variant, func in workload["variants"].items():
+            if func is None or func is reference:
+                continue
+            for n in sizes:
+                expected, actual = reference(n), func(n)
+                if expected != actual:
+                    raise ValueError(f"{name} {variant} variant returned {actual} for n = {n}, expected {expected}")
+
+
+def run_experiment(values, workloads=None):
+    """
+    Time every variant of every workload on each n.
+    Returns {workload: {variant: {n: seconds}}}; raises ValueError if a fast variant
+    disagrees with the reference at any measured n.
+    """
+    results = {}
+    for name in workloads or WORKLOADS:
+        variants = WORKLOADS[name]["variants"]
+        results[name] = {variant: {} for variant, func in variants.items() if func is not None}
+        for value in values:
+            reference_time, expected = timed_run(variants["reference"], value)
+            results[name]["reference"][value] = reference_time
+            for variant, func in variants.items():
+                if func is None or variant == "reference":
+                    continue
+                elapsed, actual = timed_run(func, value)
+                if actual != expected:
+                    raise ValueError(f"{name} {variant} variant returned {actual} for n = {value}, expected {expected}")
+                results[name][variant][value] = elapsed
+    return results
 
 
 def print_tabulated_data(title, data):
@@ -45,6 +130,29 @@ def print_tabulated_data(title, data):
     for key, value in data.items():
         print(f"  n = {key:<8} => {value:.8f} seconds")
 
+
+def print_speedups(name, timings):
+    """Print each variant's time and its speedup over the reference, plus the reference's growth."""
+    complexity = WORKLOADS[name]["complexity"]
+    variants = [variant for variant in VARIANTS if variant in timings]
+    print(f"\n{name} ({complexity}) variant comparison:")
+    header = f"  {'n':<10}" + "".join(f"{variant:>24}" for variant in variants) + f"{'growth':>10}"
+    print(header)
+
+    previous = None
+    for n, reference_time in timings["reference"].items():
+        row = f"  {n:<10}"
+        for variant in variants:
+            elapsed = timings[variant][n]
+            speedup = reference_time / elapsed if elapsed > 0 else float("inf")
+            row += f"{elapsed:>13.8f}s ({speedup:>6.0f}x)" if variant != "reference" else f"{elapsed:>23.8f}s"
+        # how much the reference time grew since the previous n
+        growth = f"{reference_time / previous:.1f}x" if previous else "-"
+        row += f"{growth:>10}"
+        print(row)
+        previous = reference_time
+
+
 def main():
     # Number of test cases
     n = int(input("How many different values of n would you like to test? "))
@@ -52,18 +160,16 @@ def main():
     # Input values for n
     values = [int(input(f"Enter value #{i + 1}: ")) for i in range(n)]
 
-    linear_sum_times = {}
-    nested_sum_times = {}
-
-    # Collect timing data
-    for value in values:
-        linear_sum_times[value] = algorithm_time(linear_sum, value)
-        nested_sum_times[value] = algorithm_time(nested_sum, value)
+    verify_workloads()
+    results = run_experiment(values)
 
     # Print the timing comparison
-    print_tabulated_data("Linear Sum (O(n)) Times", linear_sum_times)
-    print_tabulated_data("Nested Sum (O(n²)) Times", nested_sum_times)
+    for name, timings in results.items():
+        print_tabulated_data(f"{name} ({WORKLOADS[name]['complexity']}) Times", timings["reference"])
+
+    for name, timings in results.items():
+        print_speedups(name, timings)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,76 @@
+"""
+profile_cli.py
+
+Command-line wiring for the sampling profiler (algorithms/profiler.py).
+
+This module is imported eagerly by the scripts, so it only defines the arguments and imports
+nothing beyond the standard startup modules; the profiler itself (with signal, threading and
+contextlib) is imported the first time profiling is requested.
+
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiler = profiler_from_args(args)          # None unless --profile / --profile_on_signal
+    with section(profiler, "Merge Sort"):
+        ...
+    finish_profile(profiler, args.profile)
+"""
+
+import os
+
+DEFAULT_INTERVAL = 0.001  # seconds of CPU time between samples
+DEFAULT_OUTPUT = "profile.collapsed"
+
+
+def add_profile_arguments(parser):
+    """Add --profile, --profile_interval and --profile_on_signal to an argparse parser."""
+    parser.add_argument("--profile", nargs="?", const=DEFAULT_OUTPUT, metavar="PATH",
+                        help=f"Record a sampling CPU profile and write collapsed stacks to PATH "
+                             f"(default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--profile_interval", type=float, default=DEFAULT_INTERVAL,
+                        help="Seconds of CPU time between profile samples")
+    parser.add_argument("--profile_on_signal", action="store_true",
+                        help="Arm the profiler without starting it; SIGUSR2 toggles sampling on and off")
+
+
+def profiler_from_args(args):
+    """
+    Returns a running (or, with --profile_on_signal, armed) SamplingProfiler,
+    or None when profiling was not requested.
+    """
+    if not args.profile and not args.profile_on_signal:
+        return None
+    from algorithms.profiler import SamplingProfiler
+
+    profiler = SamplingProfiler(args.profile_interval)
+    if args.profile_on_signal:
+        profiler.toggle_on_signal()
+        print(f"Profiler armed: kill -USR2 {os.getpid()} to start or stop sampling.")
+    else:
+        profiler.start()
+    return profiler
+
+
+class _NoSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_SECTION = _NoSection()
+
+
+def section(profiler, label):
+    """profiler.section(label), or a do-nothing context manager when profiler is None."""
+    return _NO_SECTION if profiler is None else profiler.section(label)
+
+
+def finish_profile(profiler, path=None):
+    """Stop the profiler, write its collapsed stacks and print the hottest functions."""
+    if profiler is None:
+        return
+    profiler.stop()
+    path = profiler.write_collapsed(path or DEFAULT_OUTPUT)
+    profiler.print_summary()
+    print(f"Collapsed stacks written to {path} (render with flamegraph.pl or speedscope).")
@@ -0,0 +1,185 @@
+"""
+profiler.py
+
+Opt-in sampling CPU profiler for the sorting and hash table benchmarks.
+
+While running, the profiler interrupts the process every `interval` seconds of CPU time
+(signal.setitimer with ITIMER_PROF) and records the Python call stack that was executing.
+Nothing is instrumented: when the profiler is stopped no timer is armed and no code runs,
+so it can stay wired into the benchmarks and be switched on for production-sized runs.
+On platforms without setitimer (Windows) a background thread samples the main thread
+instead, on wall-clock time.
+
+Samples are kept as collapsed stacks ("outer;inner;innermost count" per line), the input
+format of flamegraph.pl, speedscope and inferno:
+
+    from algorithms.profiler import SamplingProfiler
+
+    profiler = SamplingProfiler()
+    with profiler, profiler.section("Merge Sort"):
+        merge_sort(data)
+    profiler.write_collapsed("merge_sort.collapsed")   # flamegraph.pl merge_sort.collapsed > out.svg
+    profiler.print_summary()
+
+section() labels the samples taken inside it, so one profile of a whole comparator run
+still separates the algorithms. toggle_on_signal() lets a long run be profiled from the
+outside: `kill -USR2 <pid>` starts sampling, a second one stops it.
+
+Scripts wire it up through algorithms/profile_cli.py, which only imports this module when
+profiling is actually requested.
+"""
+
+import os
+import signal
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+from algorithms.profile_cli import DEFAULT_INTERVAL
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _frame_file(function):
+    return function.__code__.co_filename
+
+
+class SamplingProfiler:
+    """Statistical profiler that counts sampled call stacks."""
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples = Counter()
+        self.running = False
+        self._sections = []
+        self._use_timer = hasattr(signal, "setitimer")
+        self._previous_handler = None
+        self._thread = None
+        # The profiler's own frames (and the fallback thread's) are left out of the stacks
+        self._skip_files = {_frame_file(_frame_label), _frame_file(threading.Thread.run)}
+
+    # -----------------------------
+    # Sampling
+    # -----------------------------
+
+    def _record(self, frame):
+        stack = []
+        while frame is not None:
+            if frame.f_code.co_filename not in self._skip_files:
+                stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if self._sections:
+            stack.append(self._sections[-1])
+        if stack:
+            stack.reverse()
+            self.samples[";".join(stack)] += 1
+
+    def _on_signal(self, signum, frame):
+        self._record(frame)
+
+    def _sample_thread(self, target_id):
+        # Fallback without setitimer: sample the main thread's current frame periodically
+        while self.running:
+            frame = sys._current_frames().get(target_id)
+            if frame is not None:
+                self._record(frame)
+            threading.Event().wait(self.interval)
+
+    def start(self):
+        """Start (or resume) sampling; samples accumulate across start/stop pairs."""
+        if self.running:
+            return
+        self.running = True
+        if self._use_timer:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._thread = threading.Thread(target=self._sample_thread,
+                                            args=(threading.main_thread().ident,), daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop sampling; the process runs with no profiling cost until the next start()."""
+        if not self.running:
+            return
+        self.running = False
+        if self._use_timer:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        elif self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def toggle(self):
+        """Switch sampling on or off."""
+        if self.running:
+            self.stop()
+        else:
+            self.start()
+
+    def toggle_on_signal(self, signum=None):
+        """Make a signal (SIGUSR2 by default) toggle sampling in this process."""
+        signum = signum or signal.SIGUSR2
+        signal.signal(signum, lambda received, frame: self.toggle())
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextmanager
+    def section(self, name):
+        """Label the samples taken inside the block with name (a root frame in the flamegraph)."""
+        self._sections.append(name)
+        try:
+            yield
+        finally:
+            self._sections.pop()
+
+    # -----------------------------
+    # Output
+    # -----------------------------
+
+    def collapsed(self):
+        """Collapsed stack lines, most frequent first."""
+        return [f"{stack} {count}" for stack, count in self.samples.most_common()]
+
+    def write_collapsed(self, path):
+        """Write the samples in collapsed-stack format and return the path."""
+        with open(path, "w", encoding="utf-8") as file:
+            for line in self.collapsed():
+                file.write(line + "\n")
+        return path
+
+    def function_totals(self):
+        """
+        Returns:
+            tuple: (self samples per frame, inclusive samples per frame); a recursive frame
+            is counted once per sample in the inclusive totals.
+        """
+        self_counts = Counter()
+        total_counts = Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(";")
+            self_counts[frames[-1]] += count
+            for frame in set(frames):
+                total_counts[frame] += count
+        return self_counts, total_counts
+
+    def print_summary(self, limit=15):
+        total = sum(self.samples.values())
+        print(f"\nSampling profile: {total} samples every {self.interval * 1000:g} ms "
+              f"({'CPU' if self._use_timer else 'wall'} time)")
+        if not total:
+            return
+        self_counts, total_counts = self.function_totals()
+        print(f"{'Self %':>7} {'Total %':>8}  Function")
+        for frame, count in self_counts.most_common(limit):
+            print(f"{count / total:>7.1%} {total_counts[frame] / total:>8.1%}  {frame}")
+
@@ -0,0 +1,47 @@
+"""
+Record Sorting
+Sorts records (dicts) by one field, for the patient records experiments.
+bubble_sort works in place; merge_sort is stable and returns a new list.
+"""
+
+
+def bubble_sort(records, key="id"):
+    """Sorts the patient records using Bubble Sort based on the specified key."""
+    n = len(records)
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            if records[j][key] > records[j + 1][key]:
+                records[j], records[j + 1] = records[j + 1], records[j]
+                swapped = True
+        if not swapped:
+            break
+    return records
+
+def merge_sort(records, key="id"):
+    """Sorts the patient records using Merge Sort based on the specified key."""
+    if len(records) <= 1:
+        return records
+
+    mid = len(records) // 2
+    left_half = merge_sort(records[:mid], key)
+    right_half = merge_sort(records[mid:], key)
+
+    return merge(left_half, right_half, key)
+
+def merge(left, right, key):
+    sorted_list = []
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        if left[i][key] <= right[j][key]:
+            sorted_list.append(left[i])
+            i += 1
+        else:
+            sorted_list.append(right[j])
+            j += 1
+
+    # Append remaining elements
+    sorted_list.extend(left[i:])
+    sorted_list.extend(right[j:])
+    return sorted_list
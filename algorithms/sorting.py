@@ -0,0 +1,243 @@
+"""
+sorting.py
+
+The list sorting engines shared by the comparators (sorting_comparator*.py), sample_sort.py
+and smart_sort.py. Every function sorts the sequence it is given and returns it (Quick Sort
+returns a new list); the in-place ones also work on arrays and memory-mapped buffers.
+
+Engines are looked up by name through the lazy registry in algorithms/__init__.py, so this
+module is only imported the first time one of them is used.
+"""
+
+
+def bubble_sort(arr):
+    number_of_elements = len(arr)
+    for i in range(number_of_elements):
+        has_swapped = False
+        for j in range(0, number_of_elements - i - 1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                has_swapped = True
+        if not has_swapped:
+            break
+    return arr
+
+def _slice_copy(arr, start, stop):
+    # Slicing a memoryview (e.g. a memory-mapped file) gives a view, not a copy
+    part = arr[start:stop]
+    return part.tolist() if isinstance(part, memoryview) else part
+
+def merge_sort(arr):
+    if len(arr) > 1:
+        mid = len(arr) // 2
+        left_half = _slice_copy(arr, None, mid)
+        right_half = _slice_copy(arr, mid, None)
+        merge_sort(left_half)
+        merge_sort(right_half)
+        i = j = k = 0
+        while i < len(left_half) and j < len(right_half):
+            if left_half[i] < right_half[j]:
+                arr[k] = left_half[i]
+                i += 1
+            else:
+                arr[k] = right_half[j]
+                j += 1
+            k += 1
+        while i < len(left_half):
+            arr[k] = left_half[i]
+            i += 1
+            k += 1
+        while j < len(right_half):
+            arr[k] = right_half[j]
+            j += 1
+            k += 1
+    return arr
+
+def quick_sort(arr):
+    if len(arr) <= 1:
+        return arr
+    pivot = arr[len(arr) // 2]
+    less = [x for x in arr if x < pivot]
+    equal = [x for x in arr if x == pivot]
+    greater = [x for x in arr if x > pivot]
+    return quick_sort(less) + equal + quick_sort(greater)
+
+def insertion_sort(arr):
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        while j >= 0 and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+    return arr
+
+def heapify(arr, n, i):
+    largest = i
+    left = 2 * i + 1
+    right = 2 * i + 2
+    if left < n and arr[left] > arr[largest]:
+        largest = left
+    if right < n and arr[right] > arr[largest]:
+        largest = right
+    if largest != i:
+        arr[i], arr[largest] = arr[largest], arr[i]
+        heapify(arr, n, largest)
+
+def heap_sort(arr):
+    n = len(arr)
+    for i in range(n // 2 - 1, -1, -1):
+        heapify(arr, n, i)
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        heapify(arr, i, 0)
+    return arr
+
+def radix_sort(arr):
+    # LSD radix sort on integers, one byte per pass; results are written back element by
+    # element so it sorts lists, arrays and memory-mapped buffers in place
+    if len(arr) <= 1:
+        return arr
+    minimum = min(arr)
+    values = [x - minimum for x in arr]  # shift so negative values sort correctly
+    max_value = max(values)
+    shift = 0
+    while (max_value >> shift) > 0:
+        buckets = [[] for _ in range(256)]
+        for value in values:
+            buckets[(value >> shift) & 0xFF].append(value)
+        values = [value for bucket in buckets for value in bucket]
+        shift += 8
+    for i, value in enumerate(values):
+        arr[i] = value + minimum
+    return arr
+
+# Counting sort allocates one counter per value in the range; past this many counters per
+# element (plus a fixed allowance for small inputs) it hands the input to radix sort instead
+COUNTING_MAX_RANGE_FACTOR = 16
+COUNTING_MIN_RANGE_ALLOWANCE = 1 << 16
+
+def counting_sort(arr):
+    # Integers only; O(n + k) for a value range of k, so it suits small ranges
+    if len(arr) <= 1:
+        return arr
+    minimum = min(arr)
+    value_range = max(arr) - minimum + 1
+    if value_range > COUNTING_MAX_RANGE_FACTOR * len(arr) + COUNTING_MIN_RANGE_ALLOWANCE:
+        # Too wide for a counts array (e.g. 64-bit values): bounded-memory radix sort
+        return radix_sort(arr)
+    counts = [0] * value_range
+    for value in arr:
+        counts[value - minimum] += 1
+    i = 0
+    for offset, count in enumerate(counts):
+        value = offset + minimum
+        for _ in range(count):
+            arr[i] = value
+            i += 1
+    return arr
+
+def _merge_runs(left, right):
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            merged.append(right[j])
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged
+
+def natural_merge_sort(arr):
+    # Splits the input into its existing ascending runs (reversing strictly descending
+    # ones) and merges neighbouring runs, so nearly sorted input needs very few passes
+    n = len(arr)
+    if n <= 1:
+        return arr
+    runs = []
+    start = 0
+    while start < n:
+        end = start + 1
+        if end < n and arr[end] < arr[start]:
+            while end < n and arr[end] < arr[end - 1]:
+                end += 1
+            runs.append(list(arr[start:end])[::-1])
+        else:
+            while end < n and arr[end] >= arr[end - 1]:
+                end += 1
+            runs.append(list(arr[start:end]))
+        start = end
+    while len(runs) > 1:
+        paired = [_merge_runs(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            paired.append(runs[-1])
+        runs = paired
+    for i, value in enumerate(runs[0]):
+        arr[i] = value
+    return arr
+
+def _insertion_sort_range(arr, low, high):
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+def _sift_down(arr, offset, root, size):
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and arr[offset + child + 1] > arr[offset + child]:
+            child += 1
+        if arr[offset + root] >= arr[offset + child]:
+            return
+        arr[offset + root], arr[offset + child] = arr[offset + child], arr[offset + root]
+        root = child
+
+def _heap_sort_range(arr, low, high):
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, low, root, size)
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        _sift_down(arr, low, 0, end)
+
+def _intro_sort(arr, low, high, depth_limit):
+    while high - low > 16:
+        if depth_limit == 0:
+            # Quicksort is degenerating on this input: finish this range with heap sort
+            _heap_sort_range(arr, low, high)
+            return
+        depth_limit -= 1
+        a, b, c = arr[low], arr[(low + high) // 2], arr[high]
+        pivot = sorted((a, b, c))[1]
+        i, j = low, high
+        while i <= j:
+            while arr[i] < pivot:
+                i += 1
+            while arr[j] > pivot:
+                j -= 1
+            if i <= j:
+                arr[i], arr[j] = arr[j], arr[i]
+                i += 1
+                j -= 1
+        # Recurse into the smaller side and loop on the larger to bound the stack depth
+        if j - low < high - i:
+            _intro_sort(arr, low, j, depth_limit)
+            low = i
+        else:
+            _intro_sort(arr, i, high, depth_limit)
+            high = j
+    _insertion_sort_range(arr, low, high)
+
+def intro_sort(arr):
+    # In-place quicksort (median-of-three) with a heap sort fallback after 2*log2(n)
+    # levels and insertion sort for small ranges
+    _intro_sort(arr, 0, len(arr) - 1, 2 * len(arr).bit_length())
+    return arr
@@ -0,0 +1,12 @@
+"""
+Puts the repository root on sys.path, so the scripts in this folder can import the shared
+algorithms package when they are run directly (e.g. python hashtable_benchmark.py).
+Imported for its side effect only.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
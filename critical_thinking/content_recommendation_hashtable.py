@@ -1,4 +1,5 @@
 import random
+import time
 
 class HashTable:
     """Simple Hash Table implementation using chaining."""
@@ -62,26 +63,27 @@ class HashTable:
         else:
             print("This bucket is empty (no entry for that key).")
 
-def generate_user_preferences():
-    """Simulate random user preferences."""
+def generate_user_preferences(rng=random):
+    """Simulate random user preferences (drawn from rng, the global random module by default)."""
     possible_preferences = [
         "sports_videos", "comedy_shows", "tech_news", "gaming_streams", 
         "cooking_tutorials", "travel_vlogs", "music_clips", "movie_trailers", 
         "fitness_tips", "fashion_advice"
     ]
     # Randomly pick a few interests to represent a user’s preferences
-    num_prefs = random.randint(1, 3)
-    return random.sample(possible_preferences, num_prefs)
+    num_prefs = rng.randint(1, 3)
+    return rng.sample(possible_preferences, num_prefs)
 
-def populate_hash_table(hash_table, num_users=5):
+def populate_hash_table(hash_table, num_users=5, rng=random):
     """
     Simulated user data for the hash table.
     :param hash_table: An instance of the HashTable class.
     :param num_users: Number of random user records to generate.
+    :param rng: Source of randomness (the global random module by default).
     """
     for i in range(num_users):
         user_id = f"user_{100 + i}"
-        hash_table.insert(user_id, generate_user_preferences())
+        hash_table.insert(user_id, generate_user_preferences(rng))
 
 def generate_recommendations(user_id, hash_table):
     """
@@ -93,6 +95,42 @@ def generate_recommendations(user_id, hash_table):
         return f"No preferences found for {user_id}."
     return f"Recommendations for {user_id}: {user_preferences}"
 
+def bucket_stats(hash_table):
+    """Summarize how evenly the entries are spread over the buckets."""
+    lengths = [len(bucket) for bucket in hash_table.table]
+    entries = sum(lengths)
+    return {
+        "entries": entries,
+        "load_factor": entries / hash_table.size,
+        "empty_buckets": lengths.count(0),
+        "max_bucket_length": max(lengths),
+        # entries sharing a bucket with at least one other entry
+        "colliding_entries": sum(length for length in lengths if length > 1),
+    }
+
+def run_simulation(table_size, user_count, lookups=1000, seed=None):
+    """
+    Non-interactive run: build and populate a table, then time random user lookups.
+    :param table_size: Number of buckets.
+    :param user_count: Number of simulated users to insert.
+    :param lookups: Number of get() calls to time.
+    :param seed: Optional seed so the simulated users are reproducible.
+    :return: Bucket statistics plus the average lookup time in seconds.
+    """
+    rng = random.Random(seed)
+    hash_table = HashTable(size=table_size)
+    populate_hash_table(hash_table, num_users=user_count, rng=rng)
+
+    user_ids = [f"user_{100 + rng.randrange(user_count)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for user_id in user_ids:
+        hash_table.get(user_id)
+    elapsed = time.perf_counter() - start
+
+    stats = bucket_stats(hash_table)
+    stats["avg_lookup_seconds"] = elapsed / lookups if lookups else 0.0
+    return stats
+
 def main():
     # Prompt user for the hash table size
     while True:
@@ -0,0 +1,357 @@
+"""
+Hash Table Benchmark
+Stress and latency benchmark for the chaining HashTable, with the builtin dict as a baseline.
+
+A workload is a seeded stream of get / insert / delete operations over a fixed key space:
+  - read_ratio:   share of operations that are gets; the rest are writes, split between
+                  inserts and deletes by delete_share
+  - zipf:         key skew; key of popularity rank r is drawn with weight 1 / r**zipf
+                  (0 = uniform, around 1 = typical cache/web traffic)
+  - prefill:      share of the key space inserted before the timed operations start
+
+Each table is measured on the same stream:
+  - throughput:   operations per second over the whole stream, without per-op timers
+  - latency:      every operation timed on its own (perf_counter_ns, minus the timer's own
+                  cost) and summarized as p50 / p99 / p999 per operation type
+  - memory:       bytes allocated per entry while inserting every key (tracemalloc)
+  - chains:       HashTable bucket length histogram and the probe length (entries compared)
+                  histogram, p50 / p99 / max of successful and unsuccessful lookups; dict's
+                  probing is internal to CPython
+
+Both tables are driven through the same insert/get/delete methods (DictTable wraps dict), so
+the difference in the results is the cost of the table itself, not of the driver loop.
+
+With --profile the run is also sampled by the CPU profiler (algorithms/profiler.py), with
+each table's throughput and latency passes as separate roots of the flamegraph.
+
+Example:
+    python hashtable_benchmark.py --ops 2000000 --read_ratio 0.9 --zipf 1.1 --profile
+"""
+
+import random
+import time
+from array import array
+from collections import Counter
+from itertools import accumulate
+
+import _repo_path  # noqa: F401
+
+from algorithms.profile_cli import add_profile_arguments, finish_profile, profiler_from_args, section
+from content_recommendation_hashtable import HashTable
+
+GET, INSERT, DELETE = 0, 1, 2
+OPERATION_NAMES = ("get", "insert", "delete")
+
+
+class DictTable:
+    """The builtin dict behind HashTable's insert/get/delete interface."""
+
+    def __init__(self, size=None):
+        self.data = {}
+
+    def insert(self, key, value):
+        self.data[key] = value
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        try:
+            del self.data[key]
+            return True
+        except KeyError:
+            return False
+
+
+TABLES = {
+    "HashTable": HashTable,
+    "dict": DictTable,
+}
+
+
+# -----------------------------
+# Workload generation
+# -----------------------------
+
+def make_keys(key_space):
+    """Keys in the same form as the recommendation simulation's user ids."""
+    return [f"user_{100 + i}" for i in range(key_space)]
+
+
+def generate_workload(key_space, ops, read_ratio=0.8, delete_share=0.5, zipf=1.0, seed=0):
+    """
+    Builds the operation stream.
+    :return: (operation codes as array('b'), key index per operation as array('l'))
+    """
+    rng = random.Random(seed)
+    # Popularity rank -> key index, shuffled so hot keys are not neighbours
+    ranked = list(range(key_space))
+    rng.shuffle(ranked)
+    cumulative = list(accumulate(1 / (rank ** zipf) for rank in range(1, key_space + 1)))
+    key_indexes = array("l", rng.choices(ranked, cum_weights=cumulative, k=ops))
+
+    write_ratio = 1 - read_ratio
+    weights = (read_ratio, write_ratio * (1 - delete_share), write_ratio * delete_share)
+    operations = array("b", rng.choices((GET, INSERT, DELETE), weights=weights, k=ops))
+    return operations, key_indexes
+
+
+def prefilled_table(table_name, keys, buckets, prefill, seed=0):
+    """New table holding a seeded prefill share of the keys."""
+    table = TABLES[table_name](buckets)
+    count = int(len(keys) * prefill)
+    for key in random.Random(seed).sample(keys, count):
+        table.insert(key, key)
+    return table
+
+
+# -----------------------------
+# Measurements
+# -----------------------------
+
+def run_throughput(table, keys, operations, key_indexes):
+    """
+    Runs the stream without per-operation timers.
+    :return: Operations per second.
+    """
+    get, insert, delete = table.get, table.insert, table.delete
+    start = time.perf_counter()
+    for operation, index in zip(operations, key_indexes):
+        key = keys[index]
+        if operation == GET:
+            get(key)
+        elif operation == INSERT:
+            insert(key, key)
+        else:
+            delete(key)
+    elapsed = time.perf_counter() - start
+    return len(operations) / elapsed if elapsed else float("inf")
+
+
+def timer_overhead_ns(samples=10000):
+    """Median cost of two back-to-back perf_counter_ns calls, subtracted from every latency."""
+    clock = time.perf_counter_ns
+    costs = []
+    for _ in range(samples):
+        start = clock()
+        costs.append(clock() - start)
+    costs.sort()
+    return costs[len(costs) // 2]
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_latency(table, keys, operations, key_indexes):
+    """
+    Times every operation of the stream on its own.
+    :return: {operation name: {"count", "mean_ns", "p50_ns", "p99_ns", "p999_ns", "max_ns"}}
+    """
+    clock = time.perf_counter_ns
+    overhead = timer_overhead_ns()
+    get, insert, delete = table.get, table.insert, table.delete
+    latencies = (array("q"), array("q"), array("q"))
+    for operation, index in zip(operations, key_indexes):
+        key = keys[index]
+        if operation == GET:
+            start = clock()
+            get(key)
+            elapsed = clock() - start
+        elif operation == INSERT:
+            start = clock()
+            insert(key, key)
+            elapsed = clock() - start
+        else:
+            start = clock()
+            delete(key)
+            elapsed = clock() - start
+        latencies[operation].append(elapsed - overhead if elapsed > overhead else 0)
+
+    summary = {}
+    for code, values in enumerate(latencies):
+        if not values:
+            continue
+        ordered = sorted(values)
+        summary[OPERATION_NAMES[code]] = {
+            "count": len(ordered),
+            "mean_ns": sum(ordered) / len(ordered),
+            "p50_ns": percentile(ordered, 50),
+            "p99_ns": percentile(ordered, 99),
+            "p999_ns": percentile(ordered, 99.9),
+            "max_ns": ordered[-1],
+        }
+    return summary
+
+
+def memory_per_entry(table_name, keys, buckets):
+    """
+    Bytes allocated per entry while inserting every key into an empty table (the keys and
+    values already exist, so only the table's own structures are counted).
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        table = TABLES[table_name](buckets)
+        for key in keys:
+            table.insert(key, key)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(keys)
+
+
+def probe_summary(probes):
+    """
+    Distribution of probe lengths (entries compared per lookup).
+    :return: {"count", "mean", "p50", "p99", "max", "histogram": {probe length: lookups}}
+    """
+    probes = sorted(probes)
+    return {
+        "count": len(probes),
+        "mean": sum(probes) / len(probes) if probes else 0.0,
+        "p50": percentile(probes, 50),
+        "p99": percentile(probes, 99),
+        "max": probes[-1] if probes else None,
+        "histogram": dict(sorted(Counter(probes).items())),
+    }
+
+
+def chain_stats(table, keys):
+    """
+    Bucket length histogram and probe length distributions of a chaining HashTable.
+    A successful lookup compares entries up to and including its own; an unsuccessful one
+    compares every entry of its bucket.
+    """
+    lengths = [len(bucket) for bucket in table.table]
+    present = []
+    missing = []
+    for key in keys:
+        bucket = table.table[table._hash_function(key)]
+        for position, element in enumerate(bucket, 1):
+            if element[0] == key:
+                present.append(position)
+                break
+        else:
+            missing.append(len(bucket))
+    return {
+        "bucket_length_histogram": dict(sorted(Counter(lengths).items())),
+        "load_factor": sum(lengths) / len(lengths),
+        "max_chain_length": max(lengths),
+        "successful_probes": probe_summary(present),
+        "unsuccessful_probes": probe_summary(missing),
+    }
+
+
+# -----------------------------
+# Suite
+# -----------------------------
+
+def run_benchmark(key_space=100_000, ops=1_000_000, read_ratio=0.8, delete_share=0.5, zipf=1.0,
+                  prefill=0.5, buckets=None, tables=None, seed=0, latency=True, memory=True, profiler=None):
+    """
+    Runs the workload against each table.
+    :param key_space: Number of distinct keys.
+    :param ops: Number of operations in the stream.
+    :param read_ratio: Share of gets (the rest are inserts and deletes).
+    :param delete_share: Share of the writes that are deletes.
+    :param zipf: Key skew exponent (0 = uniform).
+    :param prefill: Share of the key space inserted before the stream.
+    :param buckets: HashTable size (defaults to key_space, a load factor of at most 1).
+    :param tables: Names from TABLES to run (default: all).
+    :param seed: Seed for the keys, prefill and operation stream.
+    :param latency: Also run the per-operation latency pass.
+    :param memory: Also measure memory per entry.
+    :param profiler: Optional SamplingProfiler; its samples are labelled "<table> <phase>".
+    :return: {table name: results dict}, JSON-serializable.
+    """
+    buckets = buckets or key_space
+    keys = make_keys(key_space)
+    operations, key_indexes = generate_workload(key_space, ops, read_ratio, delete_share, zipf, seed)
+
+    results = {}
+    for name in tables or TABLES:
+        table = prefilled_table(name, keys, buckets, prefill, seed)
+        with section(profiler, f"{name} throughput"):
+            result = {"throughput_ops": run_throughput(table, keys, operations, key_indexes)}
+        if isinstance(table, HashTable):
+            # The table as the stream left it
+            result["chains"] = chain_stats(table, keys)
+        if latency:
+            table = prefilled_table(name, keys, buckets, prefill, seed)
+            with section(profiler, f"{name} latency"):
+                result["latency"] = run_latency(table, keys, operations, key_indexes)
+        if memory:
+            result["bytes_per_entry"] = memory_per_entry(name, keys, buckets)
+        results[name] = result
+    return results
+
+
+def print_report(results, baseline="dict"):
+    """Print the suite's results side by side, with ratios against the baseline table."""
+    base = results.get(baseline)
+    print(f"\n{'Table':<12} {'Throughput (ops/s)':>20} {'vs ' + baseline:>10} {'Bytes/entry':>12}")
+    print("-" * 57)
+    for name, result in results.items():
+        ratio = f"{result['throughput_ops'] / base['throughput_ops']:.2f}x" if base else "-"
+        memory = f"{result['bytes_per_entry']:.1f}" if "bytes_per_entry" in result else "-"
+        print(f"{name:<12} {result['throughput_ops']:>20,.0f} {ratio:>10} {memory:>12}")
+
+    if any("latency" in result for result in results.values()):
+        print(f"\n{'Latency (ns)':<20} {'count':>10} {'mean':>9} {'p50':>9} {'p99':>9} {'p999':>9} {'max':>10}")
+        print("-" * 81)
+        for name, result in results.items():
+            for operation, stats in result.get("latency", {}).items():
+                print(f"{name + ' ' + operation:<20} {stats['count']:>10} {stats['mean_ns']:>9.0f} "
+                      f"{stats['p50_ns']:>9} {stats['p99_ns']:>9} {stats['p999_ns']:>9} {stats['max_ns']:>10}")
+
+    for name, result in results.items():
+        if "chains" in result:
+            chains = result["chains"]
+            print(f"\n{name} chains: load factor {chains['load_factor']:.2f}, "
+                  f"longest chain {chains['max_chain_length']}")
+            histogram = chains["bucket_length_histogram"]
+            total = sum(histogram.values())
+            for length, count in histogram.items():
+                print(f"  length {length:>3}: {count:>9} buckets ({count / total:6.1%})")
+            print(f"  {'Probes':<14} {'count':>9} {'mean':>7} {'p50':>5} {'p99':>5} {'max':>5}")
+            for label, key in (("hit", "successful_probes"), ("miss", "unsuccessful_probes")):
+                probes = chains[key]
+                if probes["count"]:
+                    print(f"  {label:<14} {probes['count']:>9} {probes['mean']:>7.2f} "
+                          f"{probes['p50']:>5} {probes['p99']:>5} {probes['max']:>5}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Hash table stress and latency benchmark")
+    parser.add_argument("--key_space", type=int, default=100_000, help="Number of distinct keys")
+    parser.add_argument("--ops", type=int, default=1_000_000, help="Operations in the workload")
+    parser.add_argument("--read_ratio", type=float, default=0.8, help="Share of operations that are gets")
+    parser.add_argument("--delete_share", type=float, default=0.5, help="Share of writes that are deletes")
+    parser.add_argument("--zipf", type=float, default=1.0, help="Key skew exponent (0 = uniform)")
+    parser.add_argument("--prefill", type=float, default=0.5, help="Share of keys inserted up front")
+    parser.add_argument("--buckets", type=int, help="HashTable size (default: key_space)")
+    parser.add_argument("--tables", nargs="+", choices=sorted(TABLES), help="Tables to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the workload")
+    parser.add_argument("--no_latency", action="store_true", help="Skip the per-operation latency pass")
+    parser.add_argument("--no_memory", action="store_true", help="Skip the memory measurement")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    profiler = profiler_from_args(args)
+
+    print(f"{args.ops:,} operations over {args.key_space:,} keys: {args.read_ratio:.0%} gets, "
+          f"zipf {args.zipf}, prefill {args.prefill:.0%}")
+    benchmark_results = run_benchmark(args.key_space, args.ops, args.read_ratio, args.delete_share, args.zipf,
+                                      args.prefill, args.buckets, args.tables, args.seed,
+                                      latency=not args.no_latency, memory=not args.no_memory,
+                                      profiler=profiler)
+    print_report(benchmark_results)
+    finish_profile(profiler, args.profile)
@@ -1,30 +1,120 @@
 import time
 
+NOT_FOUND = -1
+
 def linearSearch(arr, target):
+    '''
+    Reference linear search. Returns the 0-based position of the first
+    occurrence of target, or NOT_FOUND (-1) if it is not in the list.
+    '''
     i = 0
 
     # check while i < instead of <= to avoid bounds error
     while i < len(arr):
         if arr[i] == target:
-            print(f'target value {target} found at position {i + 1}')
             # ends the loop when target found
-            return
-        
+            return i
+
         i += 1
 
-    print(f"Target {target} not found in list.")
-        
+    return NOT_FOUND
+
+
+def _isNumpyArray(arr):
+    # checked by type name so numpy is only imported when the caller already uses it
+    return type(arr).__module__ == 'numpy' and type(arr).__name__ == 'ndarray'
+
+
+def findFirst(arr, target, chunk_size=1 << 16):
+    '''
+    Vectorized linear search: same result as linearSearch, but the scan runs
+    in C. Lists and arrays use list.index; NumPy arrays use flatnonzero; other
+    sequences (e.g. memoryview) are scanned chunk by chunk.
+    '''
+    if _isNumpyArray(arr):
+        import numpy
+        hits = numpy.flatnonzero(arr == target)
+        return int(hits[0]) if len(hits) else NOT_FOUND
+
+    if hasattr(arr, 'index'):
+        try:
+            return arr.index(target)
+        except ValueError:
+            return NOT_FOUND
+
+    for start in range(0, len(arr), chunk_size):
+        chunk = list(arr[start:start + chunk_size])
+        try:
+            return start + chunk.index(target)
+        except ValueError:
+            continue
+    return NOT_FOUND
+
+
+def findAll(arr, target):
+    '''
+    Returns the 0-based positions of every occurrence of target (empty if none).
+    '''
+    if _isNumpyArray(arr):
+        import numpy
+        return numpy.flatnonzero(arr == target).tolist()
+
+    if not hasattr(arr, 'index'):
+        arr = list(arr)
+
+    positions = []
+    start = 0
+    while True:
+        try:
+            # resume each scan just past the previous hit
+            position = arr.index(target, start)
+        except ValueError:
+            return positions
+        positions.append(position)
+        start = position + 1
+
+
+def batchSearch(arr, targets):
+    '''
+    Answers many targets in a single pass over arr. Returns a dict mapping
+    each target to the position of its first occurrence, or NOT_FOUND.
+    The scan stops early once every target has been found.
+    '''
+    wanted = set(targets)
+    positions = {}
+
+    for i, value in enumerate(arr):
+        # set probe: one O(1) check per element regardless of how many targets
+        if value in wanted and value not in positions:
+            positions[value] = i
+            if len(positions) == len(wanted):
+                break
+
+    return {target: positions.get(target, NOT_FOUND) for target in wanted}
+
+
+def reportSearch(arr, target, search=findFirst):
+    '''
+    Runs a search and prints the result the way the original linearSearch did.
+    '''
+    position = search(arr, target)
+    if position == NOT_FOUND:
+        print(f"Target {target} not found in list.")
+    else:
+        print(f'target value {target} found at position {position + 1}')
+    return position
+
 
 def testRun(target):
     '''
     multiple lists filled to over 1000 slots to aid with analyzing run time.
     '''
-    
-    # 1) First run: target value '7' is at the end       
+
+    # 1) First run: target value '7' is at the end
     arr_end = (([31, 3, 54, 50, 203, 59, 201] * 21) * 1000) + [42, 99, 7]
     print(f"First Run:\n  Target: {target}\n  List has {len(arr_end)} elements")
     start_time = time.time()
-    linearSearch(arr_end, target)
+    reportSearch(arr_end, target)
     end_time = time.time()
     print(f"Time taken: {end_time - start_time:.6f} seconds\n")
 
@@ -32,7 +122,7 @@ def testRun(target):
     arr_front = [7] + (([31, 3, 54, 50, 203, 59, 201] * 21) * 1000) + [42, 99]
     print(f"Second Run:\n  Target: {target}\n  List has {len(arr_front)} elements")
     start_time = time.time()
-    linearSearch(arr_front, target)
+    reportSearch(arr_front, target)
     end_time = time.time()
     print(f"Time taken: {end_time - start_time:.6f} seconds\n")
 
@@ -40,7 +130,7 @@ def testRun(target):
     arr_missing = (([31, 3, 54, 50, 203, 59, 201, 42, 99] * 21) * 1000) + [123, 456, 789, 111, 222, 333]
     print(f"Third Run:\n  Target: {target}\n  List has {len(arr_missing)} elements")
     start_time = time.time()
-    linearSearch(arr_missing, target)
+    reportSearch(arr_missing, target)
     end_time = time.time()
     print(f"Time taken: {end_time - start_time:.6f} seconds\n")
 
@@ -48,8 +138,26 @@ def testRun(target):
     arr_multiple = ([12, 5, 63, 87, 4, 88, 9, 3, 22, 3] * 1000) + ([7, 31, 3, 7, 54, 50, 7, 203, 59, 201] * 15)
     print(f"Fourth Run:\n  Target: {target}\n  List has {len(arr_multiple)} elements")
     start_time = time.time()
-    linearSearch(arr_multiple, target)
+    reportSearch(arr_multiple, target)
+    end_time = time.time()
+    print(f"Time taken: {end_time - start_time:.6f} seconds")
+    start_time = time.time()
+    positions = findAll(arr_multiple, target)
     end_time = time.time()
+    if positions:
+        print(f"target value {target} occurs {len(positions)} times (first at {positions[0] + 1}, last at {positions[-1] + 1})")
+    else:
+        print(f"target value {target} occurs 0 times")
+    print(f"Time taken (findAll): {end_time - start_time:.6f} seconds\n")
+
+    # 5) Fifth run: many targets answered with one pass over the list
+    targets = range(1_000_000)
+    print(f"Fifth Run:\n  Targets: {len(targets)}\n  List has {len(arr_end)} elements")
+    start_time = time.time()
+    found = batchSearch(arr_end, targets)
+    end_time = time.time()
+    hits = sum(1 for position in found.values() if position != NOT_FOUND)
+    print(f"{hits} of {len(targets)} targets found in a single scan")
     print(f"Time taken: {end_time - start_time:.6f} seconds\n")
 
 
@@ -58,4 +166,3 @@ if __name__=='__main__':
     target = 7
 
     testRun(target)
-
@@ -0,0 +1,180 @@
+"""
+Parallel Search
+Multi-core first-occurrence linear search over packed integer arrays.
+
+The data is split into fixed-size blocks that are dealt out round-robin to worker processes
+(worker w scans blocks w, w + p, w + 2p, ...), so every worker moves through the array from
+front to back together. The data is either copied once into shared memory or memory-mapped
+straight from a binary file, so workers never receive a pickled copy of it. A mapped file is
+searched in place; a worker over shared memory copies one block at a time out of it, since
+bytes.find needs a bytes object to search.
+
+Workers share the lowest hit position found so far. Before each block a worker checks it:
+once a hit exists below the block's start, nothing that worker can still find would be the
+first occurrence, so it stops. The result is always identical to a serial scan.
+"""
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from multiprocessing import Process, Value
+from multiprocessing import shared_memory
+
+from module_1_linear_search_Abrahams import NOT_FOUND, findFirst
+
+DEFAULT_BLOCK_ITEMS = 1 << 18
+
+
+def _find_aligned(blob, packed, itemsize, start, stop):
+    """Return the byte offset of the first item-aligned match of packed in blob[start:stop], or -1."""
+    position = blob.find(packed, start, stop)
+    while position != -1 and (position - start) % itemsize:
+        position = blob.find(packed, position + 1, stop)
+    return position
+
+
+def _scan_worker(source, from_file, typecode, length, target, worker_id, workers, block_items, best):
+    """Scan this worker's blocks in order, stopping as soon as an earlier hit is known."""
+    itemsize = struct.calcsize(typecode)
+    packed = struct.pack(typecode, target)
+
+    if from_file:
+        file = open(source, "rb")
+        # mmap.find searches the mapping in place without copying the block
+        blob = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        shm = shared_memory.SharedMemory(name=source)
+        buffer = shm.buf
+
+    try:
+        num_blocks = (length + block_items - 1) // block_items
+        for block in range(worker_id, num_blocks, workers):
+            start = block * block_items
+            if best.value <= start:
+                # A hit before this block exists, and every later block is further on
+                return
+            stop = min(start + block_items, length)
+
+            if from_file:
+                position = _find_aligned(blob, packed, itemsize, start * itemsize, stop * itemsize)
+            else:
+                base = start * itemsize
+                # One block's copy at a time: the buffer itself has no find()
+                position = _find_aligned(bytes(buffer[base:stop * itemsize]), packed, itemsize,
+                                         0, (stop - start) * itemsize)
+                if position != -1:
+                    position += base
+
+            if position != -1:
+                index = position // itemsize
+                with best.get_lock():
+                    if index < best.value:
+                        best.value = index
+                return
+    finally:
+        if from_file:
+            blob.close()
+            file.close()
+        else:
+            del buffer
+            shm.close()
+
+
+def _run_workers(source, from_file, typecode, length, target, workers, block_items):
+    best = Value("q", length)
+    processes = [
+        Process(target=_scan_worker,
+                args=(source, from_file, typecode, length, target, worker_id, workers, block_items, best))
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    failed = [process.exitcode for process in processes if process.exitcode != 0]
+    if failed:
+        # A crashed worker may have skipped its blocks, so "not found" would be a guess
+        raise RuntimeError(f"{len(failed)} of {workers} search workers failed (exit codes {failed})")
+    return best.value if best.value < length else NOT_FOUND
+
+
+def _fits(typecode, target):
+    try:
+        struct.pack(typecode, target)
+    except (struct.error, TypeError):
+        return False
+    return True
+
+
+def parallel_find_first(data, target, workers=None, block_items=DEFAULT_BLOCK_ITEMS, typecode="q"):
+    """
+    Return the position of the first occurrence of target, or NOT_FOUND, using several processes.
+    :param data: A list/array of integers (copied once into shared memory), or the path of a
+                 binary file of packed integers (memory-mapped by each worker).
+    :param target: Integer to search for (a whole-number float such as 7.0 matches like 7).
+    :param workers: Number of worker processes (defaults to the number of usable cores).
+    :param block_items: Elements per block; smaller blocks cancel sooner but cost more checks.
+    :param typecode: array/struct typecode of the packed integers ('q' = int64, 'i' = int32).
+    """
+    if workers is None:
+        workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    itemsize = struct.calcsize(typecode)
+    from_file = isinstance(data, (str, os.PathLike))
+
+    if not from_file and (workers <= 1 or len(data) <= block_items):
+        return findFirst(data, target)
+
+    if isinstance(target, float) and target.is_integer():
+        # Equal to the integer, as it would be for the serial scan's == comparison
+        target = int(target)
+    if not _fits(typecode, target):
+        # The value cannot be stored in this array type, so it cannot be present
+        return NOT_FOUND
+
+    if from_file:
+        length = os.path.getsize(data) // itemsize
+        if length == 0:
+            return NOT_FOUND
+        return _run_workers(os.fspath(data), True, typecode, length, target, workers, block_items)
+
+    packed = data if isinstance(data, array) and data.typecode == typecode else array(typecode, data)
+    length = len(packed)
+    shm = shared_memory.SharedMemory(create=True, size=length * itemsize)
+    try:
+        shm.buf[:length * itemsize] = memoryview(packed).cast("B")
+        return _run_workers(shm.name, False, typecode, length, target, workers, block_items)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    target = 7
+    size = 20_000_000
+    values = array("q", [31, 3, 54, 50, 203, 59, 201]) * (size // 7)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "log_values.bin")
+        for name, position in (("front", 5), ("middle", len(values) // 2), ("end", len(values) - 1),
+                               ("missing", None)):
+            data = array("q", values)
+            if position is not None:
+                data[position] = target
+            with open(path, "wb") as file:
+                data.tofile(file)
+
+            start = time.perf_counter()
+            serial = findFirst(data, target)
+            serial_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parallel = parallel_find_first(path, target)
+            parallel_time = time.perf_counter() - start
+
+            assert serial == parallel, (serial, parallel)
+            print(f"Target at {name:<8} -> position {parallel:>9}: "
+                  f"serial {serial_time:.4f} s, parallel (mmap) {parallel_time:.4f} s")
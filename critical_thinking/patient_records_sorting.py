@@ -3,88 +3,95 @@ Patient Records Sorting System
 Enhancing the efficiency of the hospital's patient records system by comparing Bubble Sort and Merge Sort.
 """
 
+import os
 import time
-import copy
+import pickle
 import random
 import datetime
 
-def random_date(start, end):
-    """Generate random dates."""
-    delta = end - start
-    random_days = random.randrange(delta.days)
-    return start + datetime.timedelta(days=random_days)
+import _repo_path  # noqa: F401
 
-def generate_patient_records(num_records):
-    """List of dummy patient records."""
-    records = []
-    # List of names for random selection
-    names = ["Alice", "Bob", "Charlie", "David", "Eva", "Frank", "Grace", "Hannah", "Ian", "Julia"]
-    
-    # Define the range for random date generation
-    start_date = datetime.date(1950, 1, 1)
-    end_date = datetime.date(2000, 12, 31)
-    
-    # Generate a unique set of IDs 
-    unique_ids = list(range(1, num_records + 1))
-    random.shuffle(unique_ids)
-    
-    for i in range(num_records):
-        record = {
-            "id": unique_ids[i],
-            "name": random.choice(names),
-            "dob": random_date(start_date, end_date).strftime("%Y-%m-%d")
-        }
-        records.append(record)
-    return records
+from algorithms import RECORD_SORTS
+from record_index import argsort, key_column
 
-def bubble_sort(records, key="id"):
-    """Sorts the patient records using Bubble Sort based on the specified key."""
-    n = len(records)
-    for i in range(n):
-        swapped = False
-        for j in range(0, n - i - 1):
-            if records[j][key] > records[j + 1][key]:
-                records[j], records[j + 1] = records[j + 1], records[j]
-                swapped = True
-        if not swapped:
-            break
-    return records
+# List of names for random selection
+NAMES = ["Alice", "Bob", "Charlie", "David", "Eva", "Frank", "Grace", "Hannah", "Ian", "Julia"]
 
-def merge_sort(records, key="id"):
-    """Sorts the patient records using Merge Sort based on the specified key."""
-    if len(records) <= 1:
-        return records
+# Define the range for random date generation
+START_DATE = datetime.date(1950, 1, 1)
+END_DATE = datetime.date(2000, 12, 31)
 
-    mid = len(records) // 2
-    left_half = merge_sort(records[:mid], key)
-    right_half = merge_sort(records[mid:], key)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".records_cache")
 
-    return merge(left_half, right_half, key)
+def iter_patient_record_chunks(num_records, seed=None, chunk_size=100_000):
+    """
+    Yield dummy patient records in chunks of at most chunk_size.
 
-def merge(left, right, key):
-    sorted_list = []
-    i = j = 0
+    Each field is drawn for a whole chunk at once, and dates of birth are built from
+    precomputed ordinals with isoformat() instead of one strftime call per record.
+    """
+    rng = random.Random(seed)
 
-    while i < len(left) and j < len(right):
-        if left[i][key] <= right[j][key]:
-            sorted_list.append(left[i])
-            i += 1
-        else:
-            sorted_list.append(right[j])
-            j += 1
+    # Generate a unique set of IDs (a random permutation of 1..num_records)
+    unique_ids = rng.sample(range(1, num_records + 1), num_records)
 
-    # Append remaining elements
-    sorted_list.extend(left[i:])
-    sorted_list.extend(right[j:])
-    return sorted_list
+    start_ordinal = START_DATE.toordinal()
+    day_offsets = range((END_DATE - START_DATE).days)
+
+    for chunk_start in range(0, num_records, chunk_size):
+        count = min(chunk_size, num_records - chunk_start)
+        names = rng.choices(NAMES, k=count)
+        offsets = rng.choices(day_offsets, k=count)
+        yield [
+            {
+                "id": unique_ids[chunk_start + i],
+                "name": names[i],
+                "dob": datetime.date.fromordinal(start_ordinal + offsets[i]).isoformat()
+            }
+            for i in range(count)
+        ]
+
+def generate_patient_records(num_records, seed=None):
+    """List of dummy patient records (reproducible when a seed is given)."""
+    records = []
+    for chunk in iter_patient_record_chunks(num_records, seed):
+        records.extend(chunk)
+    return records
+
+def load_patient_records(num_records, seed, cache_dir=CACHE_DIR):
+    """
+    Return seeded patient records, reusing a copy cached on disk from an earlier run.
+    Returns (records, seconds spent generating or loading).
+    """
+    path = os.path.join(cache_dir, f"patients_n{num_records}_s{seed}.pickle")
+    start = time.perf_counter()
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            records = pickle.load(file)
+    else:
+        records = generate_patient_records(num_records, seed)
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump(records, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    return records, time.perf_counter() - start
 
 def measure_sorting_time(sort_func, records, key="id"):
-    records_copy = copy.deepcopy(records)
+    # The sorts only reorder the list (the record dicts are never modified), so a shallow copy is enough
+    records_copy = list(records)
     start = time.perf_counter()
     sort_func(records_copy, key)
     end = time.perf_counter()
     return end - start
 
+def measure_argsort_time(records, key="id"):
+    """Time sorting a permutation of record positions instead of the records themselves."""
+    start = time.perf_counter()
+    argsort(key_column(records, key))
+    end = time.perf_counter()
+    return end - start
+
 def get_positive_int(prompt):
     """Prompt the user for a positive integer and validate the input."""
     while True:
@@ -97,33 +104,61 @@ def get_positive_int(prompt):
         except ValueError:
             print("Invalid input. Please enter a positive integer.")
 
-# Main testing block
-if __name__ == "__main__":
-    num_records = get_positive_int("How many patients would you like to test? ")
-    num_runs = get_positive_int("How many times would you like to run the sorting tests? ")
-
+def run_sorting_tests(num_records, num_runs, key="id", cache_dir=None):
+    """
+    Time Bubble Sort and Merge Sort on num_runs fresh record sets without prompting.
+    Records are only cached on disk when a cache_dir is given (e.g. CACHE_DIR).
+    Returns a dict with the per-run and average times.
+    """
     bubble_times = []
     merge_times = []
+    argsort_times = []
+    generation_times = []
 
     for run in range(1, num_runs + 1):
         print(f"\nRun {run}:")
-        # Generate a fresh set of patient records for each run
-        records = generate_patient_records(num_records)
+        # Generate a fresh (seeded, optionally cached) set of patient records for each run
+        if cache_dir is not None:
+            records, gt = load_patient_records(num_records, seed=run, cache_dir=cache_dir)
+        else:
+            start = time.perf_counter()
+            records = generate_patient_records(num_records, seed=run)
+            gt = time.perf_counter() - start
+        print(f"  Data Generation Time: {gt:.6f} seconds")
 
         # Measure sorting times for Bubble Sort and Merge Sort
-        bt = measure_sorting_time(bubble_sort, records)
-        mt = measure_sorting_time(merge_sort, records)
+        bt = measure_sorting_time(RECORD_SORTS["Bubble Sort"], records, key)
+        mt = measure_sorting_time(RECORD_SORTS["Merge Sort"], records, key)
+        at = measure_argsort_time(records, key)
 
+        generation_times.append(gt)
         bubble_times.append(bt)
         merge_times.append(mt)
+        argsort_times.append(at)
 
         print(f"  Bubble Sort Time: {bt:.6f} seconds")
         print(f"  Merge Sort Time: {mt:.6f} seconds")
+        print(f"  Argsort (index) Time: {at:.6f} seconds")
+
+    return {
+        "generation_times": generation_times,
+        "bubble_times": bubble_times,
+        "merge_times": merge_times,
+        "argsort_times": argsort_times,
+        "avg_bubble_time": sum(bubble_times) / num_runs,
+        "avg_merge_time": sum(merge_times) / num_runs,
+        "avg_argsort_time": sum(argsort_times) / num_runs,
+    }
+
+# Main testing block
+if __name__ == "__main__":
+    num_records = get_positive_int("How many patients would you like to test? ")
+    num_runs = get_positive_int("How many times would you like to run the sorting tests? ")
 
-    # Calculate and display average execution times
-    avg_bubble_time = sum(bubble_times) / num_runs
-    avg_merge_time = sum(merge_times) / num_runs
+    results = run_sorting_tests(num_records, num_runs)
 
+    # Display average execution times
     print("\nAverage Execution Times:")
-    print(f"  Average Bubble Sort Time: {avg_bubble_time:.6f} seconds")
-    print(f"  Average Merge Sort Time: {avg_merge_time:.6f} seconds")
\ No newline at end of file
+    print(f"  Average Bubble Sort Time: {results['avg_bubble_time']:.6f} seconds")
+    print(f"  Average Merge Sort Time: {results['avg_merge_time']:.6f} seconds")
+    print(f"  Average Argsort (index) Time: {results['avg_argsort_time']:.6f} seconds")
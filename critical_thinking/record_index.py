@@ -0,0 +1,150 @@
+"""
+Record Index
+Sorts patient records by sorting a compact permutation of their positions instead of the records.
+
+argsort() returns an array of record positions ordered by a precomputed key column. It is a
+stable bottom-up merge sort that ping-pongs between two preallocated index buffers, so no
+lists are built per merge level. Because it is stable, sorting an existing order by another
+key gives a multi-key ordering (sort by the minor key first, then the major key).
+
+A RecordStore keeps one shared list of records and any number of cached orderings
+(by id, by name, by dob, ...) as permutation arrays; records are only materialized in that
+order on request, either copied once (apply_permutation) or read lazily (PermutedView).
+"""
+
+from array import array
+
+INDEX_TYPECODE = "q"
+
+
+def key_column(records, key):
+    """Extract one field of every record into a list (the column argsort compares)."""
+    return [record[key] for record in records]
+
+
+def argsort(keys, order=None, method="merge"):
+    """
+    Return the positions of keys in stable ascending key order, as an array('q').
+    :param keys: Key column (any sequence of comparable values).
+    :param order: Optional starting permutation; equal keys keep their relative order from it,
+                  which is how multi-pass (multi-key) sorts are built.
+    :param method: "merge" for the two-buffer merge sort, or "builtin" to let Python's
+                   (also stable) sorted() order the indices.
+    """
+    n = len(keys)
+    source = array(INDEX_TYPECODE, range(n) if order is None else order)
+    if len(source) != n:
+        raise ValueError(f"order has {len(source)} positions but there are {n} keys")
+
+    if method == "builtin":
+        return array(INDEX_TYPECODE, sorted(source, key=keys.__getitem__))
+    if method != "merge":
+        raise ValueError(f"Unknown argsort method '{method}'")
+
+    # Both buffers are allocated once; each pass merges runs of width from one into the other
+    scratch = array(INDEX_TYPECODE, bytes(source.itemsize * n))
+    width = 1
+    while width < n:
+        for low in range(0, n, 2 * width):
+            mid = min(low + width, n)
+            high = min(low + 2 * width, n)
+            if mid >= high or keys[source[mid - 1]] <= keys[source[mid]]:
+                # runs already in order (common for presorted input): copy them across
+                scratch[low:high] = source[low:high]
+                continue
+            i, j, k = low, mid, low
+            left, right = source[i], source[j]
+            left_key, right_key = keys[left], keys[right]
+            while True:
+                # take from the right run only when strictly smaller, which keeps the sort stable
+                if right_key < left_key:
+                    scratch[k] = right
+                    k += 1
+                    j += 1
+                    if j == high:
+                        break
+                    right = source[j]
+                    right_key = keys[right]
+                else:
+                    scratch[k] = left
+                    k += 1
+                    i += 1
+                    if i == mid:
+                        break
+                    left = source[i]
+                    left_key = keys[left]
+            # copy whichever run is left over (only one of these is non-empty)
+            scratch[k:k + mid - i] = source[i:mid]
+            k += mid - i
+            scratch[k:high] = source[j:high]
+        source, scratch = scratch, source
+        width *= 2
+    return source
+
+
+def apply_permutation(records, order):
+    """Return a new list of the records in the given order (one pass, one allocation)."""
+    return [records[i] for i in order]
+
+
+class PermutedView:
+    """Read-only, lazily evaluated view of records in a permutation's order."""
+
+    def __init__(self, records, order):
+        self.records = records
+        self.order = order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.records[i] for i in self.order[index]]
+        return self.records[self.order[index]]
+
+    def __iter__(self):
+        records = self.records
+        for i in self.order:
+            yield records[i]
+
+
+class RecordStore:
+    """One shared list of records with cached key columns and orderings."""
+
+    def __init__(self, records):
+        self.records = records
+        self._columns = {}
+        self._orders = {}
+
+    def column(self, key):
+        if key not in self._columns:
+            self._columns[key] = key_column(self.records, key)
+        return self._columns[key]
+
+    def order_by(self, *keys, method="merge"):
+        """
+        Return the (cached) permutation ordering the records by keys, most significant first.
+        """
+        if not keys:
+            raise ValueError("order_by needs at least one key")
+        if keys not in self._orders:
+            order = None
+            # stable passes from the least to the most significant key
+            for key in reversed(keys):
+                order = argsort(self.column(key), order, method)
+            self._orders[keys] = order
+        return self._orders[keys]
+
+    def view(self, *keys):
+        """Lazy view of the records ordered by keys."""
+        return PermutedView(self.records, self.order_by(*keys))
+
+    def sorted_copy(self, *keys):
+        """The records physically reordered by keys, built in a single pass."""
+        return apply_permutation(self.records, self.order_by(*keys))
+
+    def add(self, record):
+        """Append a record; cached columns and orderings are dropped since they are now stale."""
+        self.records.append(record)
+        self._columns.clear()
+        self._orders.clear()
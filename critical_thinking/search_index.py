@@ -0,0 +1,197 @@
+"""
+Search Index
+Builds a lookup index once per dataset so repeated searches stop paying for an O(n) scan each.
+
+Two index kinds are available:
+  - hash:   value -> position of its first occurrence (O(1) point lookups)
+  - sorted: (value, position) pairs in value order, searched with bisect
+            (O(log n) lookups plus range and predecessor queries)
+
+SearchIndex picks between no index, the hash index and the sorted index from the expected
+query volume, and rebuilds itself when the underlying TrackedList is modified. A plain list
+cannot report its changes, so the hash and sorted modes only accept a TrackedList.
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+
+from module_1_linear_search_Abrahams import NOT_FOUND, findFirst, linearSearch
+
+# Building the hash index costs roughly this many linear scans (measured on testRun's lists);
+# below this many queries scanning each time is cheaper. See benchmark() to re-measure.
+SCAN_BREAK_EVEN_QUERIES = 5
+
+
+class TrackedList(list):
+    """List that counts its mutations so indexes built over it can detect stale data."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def _mutated(self):
+        self.version += 1
+
+
+def _tracked(method_name):
+    method = getattr(list, method_name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._mutated()
+        return result
+
+    wrapper.__name__ = method_name
+    return wrapper
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "sort", "reverse", "clear"):
+    setattr(TrackedList, _name, _tracked(_name))
+
+
+def choose_mode(expected_queries, ordered=False):
+    """
+    Pick the index kind for a workload.
+    :param expected_queries: How many lookups will be run against the dataset.
+    :param ordered: True if range or predecessor queries are needed.
+    """
+    if ordered:
+        return "sorted"
+    if expected_queries < SCAN_BREAK_EVEN_QUERIES:
+        return "scan"
+    return "hash"
+
+
+class SearchIndex:
+    """
+    Lazily built hash or sorted index over a TrackedList, invalidated when the list changes.
+    The scan mode builds nothing and accepts any sequence.
+    """
+
+    def __init__(self, data, mode="auto", expected_queries=0, ordered=False):
+        if mode == "auto":
+            mode = choose_mode(expected_queries, ordered)
+        if mode not in ("scan", "hash", "sorted"):
+            raise ValueError(f"Unknown index mode '{mode}'")
+        if mode != "scan" and not isinstance(data, TrackedList):
+            raise TypeError(f"A {mode} index needs a TrackedList, got {type(data).__name__} "
+                            "(its changes could not invalidate the index)")
+        self.data = data
+        self.mode = mode
+        self._hash = None
+        self._keys = None
+        self._positions = None
+        self._built_for = None
+
+    def _signature(self):
+        return self.data.version
+
+    def _check_fresh(self):
+        signature = self._signature()
+        if signature != self._built_for:
+            self._hash = self._keys = self._positions = None
+            self._built_for = signature
+
+    def build_hash(self):
+        """Build value -> first position (the reversed walk lets the first occurrence win)."""
+        self._check_fresh()
+        if self._hash is None:
+            n = len(self.data)
+            self._hash = dict(zip(reversed(self.data), range(n - 1, -1, -1)))
+        return self._hash
+
+    def build_sorted(self):
+        """Build parallel key/position lists in value order (stable, so first occurrence first)."""
+        self._check_fresh()
+        if self._keys is None:
+            self._positions = sorted(range(len(self.data)), key=self.data.__getitem__)
+            self._keys = [self.data[i] for i in self._positions]
+        return self._keys, self._positions
+
+    def find(self, value):
+        """Return the position of the first occurrence of value, or NOT_FOUND."""
+        if self.mode == "scan":
+            return findFirst(self.data, value)
+        if self.mode == "hash":
+            return self.build_hash().get(value, NOT_FOUND)
+        keys, positions = self.build_sorted()
+        i = bisect_left(keys, value)
+        if i < len(keys) and keys[i] == value:
+            return positions[i]
+        return NOT_FOUND
+
+    def range(self, low, high):
+        """Return (value, position) pairs with low <= value <= high, in value order."""
+        keys, positions = self.build_sorted()
+        start = bisect_left(keys, low)
+        stop = bisect_right(keys, high)
+        return list(zip(keys[start:stop], positions[start:stop]))
+
+    def predecessor(self, value):
+        """Return (value, first position) of the largest element smaller than value, or None."""
+        keys, positions = self.build_sorted()
+        i = bisect_left(keys, value)
+        if i == 0:
+            return None
+        # step back to the first occurrence of that predecessor value
+        first = bisect_left(keys, keys[i - 1])
+        return keys[first], positions[first]
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def benchmark(data, target, scan=findFirst, repeats=5):
+    """
+    Measure when building an index pays off against repeated scans for target.
+    data must be a TrackedList. Returns a dict of per-query and build costs and the break-even query count per mode.
+    """
+    scan_time = min(_time(scan, data, target) for _ in range(repeats))
+    results = {"scan_per_query": scan_time}
+
+    for mode in ("hash", "sorted"):
+        index = SearchIndex(data, mode=mode)
+        build = getattr(index, f"build_{mode}")
+        build_time = _time(build)
+        lookup_time = min(_time(index.find, target) for _ in range(repeats))
+        saved_per_query = scan_time - lookup_time
+        results[mode] = {
+            "build": build_time,
+            "lookup_per_query": lookup_time,
+            "break_even_queries": build_time / saved_per_query if saved_per_query > 0 else float("inf"),
+        }
+    return results
+
+
+def print_benchmark(title, data, target):
+    print(f"\n{title} ({len(data)} elements, target {target}):")
+    for scan_name, scan in (("linearSearch", linearSearch), ("findFirst", findFirst)):
+        results = benchmark(data, target, scan=scan, repeats=3 if scan is linearSearch else 5)
+        print(f"  {scan_name} scan: {results['scan_per_query']:.6f} seconds per query")
+        for mode in ("hash", "sorted"):
+            r = results[mode]
+            print(f"    {mode:<6} index: build {r['build']:.6f} s, lookup {r['lookup_per_query']:.8f} s "
+                  f"-> pays off after {r['break_even_queries']:.1f} queries")
+
+
+if __name__ == "__main__":
+    target = 7
+    arr_end = TrackedList((([31, 3, 54, 50, 203, 59, 201] * 21) * 1000) + [42, 99, 7])
+    arr_front = TrackedList([7] + (([31, 3, 54, 50, 203, 59, 201] * 21) * 1000) + [42, 99])
+    arr_missing = TrackedList((([31, 3, 54, 50, 203, 59, 201, 42, 99] * 21) * 1000) + [123, 456, 789, 111, 222, 333])
+
+    print_benchmark("Target at the end", arr_end, target)
+    print_benchmark("Target at the front", arr_front, target)
+    print_benchmark("Target missing", arr_missing, target)
+
+    # Mutating a TrackedList invalidates the index automatically
+    tracked = arr_missing
+    index = SearchIndex(tracked, expected_queries=1000)
+    print(f"\nAuto mode for 1000 queries: {index.mode}; find({target}) -> {index.find(target)}")
+    tracked.append(target)
+    print(f"After appending {target}: find({target}) -> {index.find(target)}")
+    print(f"Values in [40, 60]: {len(SearchIndex(tracked, ordered=True).range(40, 60))} positions")
@@ -0,0 +1,236 @@
+"""
+Sorted Records
+Keeps patient records sorted as they arrive instead of re-sorting the whole set for every batch.
+
+SortedRecordList is a sorted list of blocks: records live in a list of small sorted blocks,
+with a parallel list of each block's largest key. An insert or delete bisects the block maxima
+(O(log n)), then bisects and shifts inside one block of at most 2 * load records, splitting
+blocks that grow too large. Range queries bisect to the first block and walk forward.
+Sorted batches can be bulk-merged in one linear pass.
+
+Records with equal keys are ordered by a unique tiebreak field (the patient id by default),
+so every record has an exact position and can be deleted.
+"""
+
+import heapq
+import time
+from bisect import bisect_left, bisect_right
+
+DEFAULT_LOAD = 1000
+# merge_sorted bulk-merges a batch once it is at least 1/BULK_MERGE_FACTOR of the collection
+BULK_MERGE_FACTOR = 8
+
+
+class SortedRecordList:
+    """Sorted collection of records supporting O(log n) insert, delete and range queries by key."""
+
+    def __init__(self, records=(), key="id", tiebreak="id", load=DEFAULT_LOAD):
+        self.key = key
+        self.tiebreak = tiebreak
+        self.load = load
+        self._blocks = []   # lists of records, each sorted
+        self._keys = []     # sort keys of the records in each block
+        self._maxes = []    # last (largest) sort key of each block
+        self._length = 0
+        if records:
+            self._rebuild(sorted(records, key=self.sort_key))
+
+    def sort_key(self, record):
+        if self.key == self.tiebreak:
+            return (record[self.key],)
+        return (record[self.key], record[self.tiebreak])
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("SortedRecordList index out of range")
+        for block in self._blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+
+    def _rebuild(self, sorted_records):
+        """Replace the contents with already sorted records, cut into blocks of load."""
+        self._blocks = [sorted_records[i:i + self.load] for i in range(0, len(sorted_records), self.load)]
+        self._keys = [[self.sort_key(record) for record in block] for block in self._blocks]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._length = len(sorted_records)
+
+    def insert(self, record):
+        """Add one record in key order."""
+        sort_key = self.sort_key(record)
+        if not self._blocks:
+            self._blocks.append([record])
+            self._keys.append([sort_key])
+            self._maxes.append(sort_key)
+            self._length = 1
+            return
+
+        b = bisect_left(self._maxes, sort_key)
+        if b == len(self._maxes):
+            # larger than everything: goes at the end of the last block
+            b -= 1
+            self._blocks[b].append(record)
+            self._keys[b].append(sort_key)
+            self._maxes[b] = sort_key
+        else:
+            keys = self._keys[b]
+            i = bisect_right(keys, sort_key)
+            keys.insert(i, sort_key)
+            self._blocks[b].insert(i, record)
+        self._length += 1
+
+        if len(self._blocks[b]) > 2 * self.load:
+            self._split(b)
+
+    def _split(self, b):
+        block, keys = self._blocks[b], self._keys[b]
+        half = len(block) // 2
+        self._blocks[b:b + 1] = [block[:half], block[half:]]
+        self._keys[b:b + 1] = [keys[:half], keys[half:]]
+        self._maxes[b:b + 1] = [keys[half - 1], keys[-1]]
+
+    def _locate(self, sort_key):
+        """Return (block, index) of the record with exactly this sort key, or None."""
+        b = bisect_left(self._maxes, sort_key)
+        if b == len(self._maxes):
+            return None
+        i = bisect_left(self._keys[b], sort_key)
+        if i < len(self._keys[b]) and self._keys[b][i] == sort_key:
+            return b, i
+        return None
+
+    def delete(self, record):
+        """Remove a record (matched by key and tiebreak); return True if it was present."""
+        location = self._locate(self.sort_key(record))
+        if location is None:
+            return False
+        b, i = location
+        del self._blocks[b][i]
+        del self._keys[b][i]
+        self._length -= 1
+        if not self._blocks[b]:
+            del self._blocks[b]
+            del self._keys[b]
+            del self._maxes[b]
+        else:
+            self._maxes[b] = self._keys[b][-1]
+        return True
+
+    def range(self, low, high):
+        """Yield records whose key is between low and high (inclusive), in order."""
+        b = bisect_left(self._maxes, (low,))
+        if b == len(self._maxes):
+            return
+        i = bisect_left(self._keys[b], (low,))
+        while b < len(self._blocks):
+            keys, block = self._keys[b], self._blocks[b]
+            while i < len(block):
+                if keys[i][0] > high:
+                    return
+                yield block[i]
+                i += 1
+            b += 1
+            i = 0
+
+    def merge_sorted(self, batch):
+        """
+        Add a batch of records, typically already sorted by key. Small batches are inserted
+        one by one; large ones are merged with the existing records in a single linear pass.
+        """
+        if len(batch) * BULK_MERGE_FACTOR < self._length:
+            for record in batch:
+                self.insert(record)
+        else:
+            # The merge needs the batch in (key, tiebreak) order; Timsort is O(n) when the
+            # batch already is, and fixes batches sorted by key alone or not at all
+            batch = sorted(batch, key=self.sort_key)
+            self._rebuild(list(heapq.merge(self, batch, key=self.sort_key)))
+
+
+if __name__ == "__main__":
+    from patient_records_sorting import generate_patient_records
+    from algorithms import RECORD_SORTS
+
+    merge_sort = RECORD_SORTS["Merge Sort"]
+
+    initial = 100_000
+    batch_size = 300
+    batches = 10
+    key = "dob"
+
+    records = generate_patient_records(initial, seed=1)
+    arrivals = []
+    for b in range(batches):
+        batch = generate_patient_records(batch_size, seed=100 + b)
+        for i, record in enumerate(batch):
+            # keep ids unique across the initial set and every batch
+            record["id"] = initial + b * batch_size + i + 1
+        arrivals.append(batch)
+
+    print(f"{initial} existing records, {batches} batches of {batch_size} new admissions, sorted by '{key}'")
+
+    start = time.perf_counter()
+    current = merge_sort(records, key)
+    for batch in arrivals:
+        current = merge_sort(current + batch, key)
+    full_time = time.perf_counter() - start
+    print(f"  Full merge_sort per batch:      {full_time:.4f} seconds")
+
+    start = time.perf_counter()
+    collection = SortedRecordList(records, key=key)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for batch in arrivals:
+        for record in batch:
+            collection.insert(record)
+    insert_time = time.perf_counter() - start
+    print(f"  SortedRecordList inserts:       {insert_time:.4f} seconds (+ {build_time:.4f} s initial build)")
+
+    assert [r[key] for r in collection] == [r[key] for r in current]
+    total = initial + batches * batch_size
+    print(f"  Throughput: {batches * batch_size / insert_time:,.0f} inserts/s vs "
+          f"{batches * batch_size / full_time:,.0f} records/s admitted with full re-sorts ({total} total)")
+
+    start = time.perf_counter()
+    in_range = sum(1 for _ in collection.range("1970-01-01", "1970-12-31"))
+    print(f"  Range query for 1970 births: {in_range} records in {time.perf_counter() - start:.6f} seconds")
+
+    # Batches large enough for merge_sorted's bulk path (heapq.merge) instead of per-record inserts
+    bulk_batches = 3
+    bulk_size = initial // 4
+    bulk_arrivals = []
+    for b in range(bulk_batches):
+        batch = generate_patient_records(bulk_size, seed=200 + b)
+        for i, record in enumerate(batch):
+            # descending ids, so the stable sort by key leaves equal keys out of (key, id) order
+            record["id"] = 2 * initial + (b + 1) * bulk_size - i
+        bulk_arrivals.append(merge_sort(batch, key))
+
+    print(f"\n{initial} existing records, {bulk_batches} sorted batches of {bulk_size} records, sorted by '{key}'")
+    start = time.perf_counter()
+    current = merge_sort(records, key)
+    for batch in bulk_arrivals:
+        current = merge_sort(current + batch, key)
+    print(f"  Full merge_sort per batch:      {time.perf_counter() - start:.4f} seconds")
+
+    collection = SortedRecordList(records, key=key)
+    start = time.perf_counter()
+    for batch in bulk_arrivals:
+        assert len(batch) * BULK_MERGE_FACTOR >= len(collection)
+        collection.merge_sorted(batch)
+    print(f"  SortedRecordList bulk merges:   {time.perf_counter() - start:.4f} seconds")
+    assert [r[key] for r in collection] == [r[key] for r in current]
+
+    # Every record must still be found by (key, tiebreak) after a bulk merge of key-only sorted batches
+    for record in records + [record for batch in bulk_arrivals for record in batch]:
+        assert collection.delete(record), record
+    assert len(collection) == 0
@@ -0,0 +1,134 @@
+"""
+binary_io.py
+
+Zero-copy access to binary files of packed integers (int32 or int64, native byte order).
+
+MappedIntArray memory-maps such a file and exposes it as a memoryview cast to the integer
+type, so it can be indexed, searched and sorted in place without first parsing the file
+into Python objects; pages are only read from disk as they are touched. Files written by
+data_generation.py use the same layout (typecode 'q').
+
+The comparator's sorts and the chunked searches (findFirst, parallel_find_first) work on
+the view directly; sort_file() writes the sorted result back through the same mapping.
+"""
+
+import mmap
+import os
+import time
+from array import array
+
+TYPECODES = ("i", "q")
+
+
+class MappedIntArray:
+    """
+    Memory-mapped view of a packed integer file.
+
+    Use as a context manager, or call open() and close() explicitly:
+
+        with MappedIntArray("values.bin") as values:
+            print(len(values), values[0])
+    """
+
+    def __init__(self, path, typecode="q", writable=False):
+        if typecode not in TYPECODES:
+            raise ValueError(f"Unsupported typecode '{typecode}', expected one of {TYPECODES}")
+        self.path = path
+        self.typecode = typecode
+        self.writable = writable
+        self._file = None
+        self._map = None
+        self.view = None
+
+    def open(self):
+        """
+        Maps the file and returns a memoryview of its integers.
+        """
+        itemsize = array(self.typecode).itemsize
+        size = os.path.getsize(self.path)
+        if size % itemsize:
+            raise ValueError(f"{self.path} is {size} bytes, not a whole number of {itemsize}-byte integers")
+
+        if size == 0:
+            # mmap cannot map an empty file
+            self.view = memoryview(array(self.typecode))
+            return self.view
+
+        self._file = open(self.path, "r+b" if self.writable else "rb")
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+        self.view = memoryview(self._map).cast(self.typecode)
+        return self.view
+
+    def close(self):
+        # The memoryview must be released before the mapping can be closed
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self._map is not None:
+            if self.writable:
+                self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_int_array(path, values, typecode="q", chunk_size=1 << 20):
+    """
+    Writes integers to a packed binary file.
+
+    Parameters:
+        path (str): Output file.
+        values: An array/memoryview of the right typecode (written in one call), or any
+            sequence of ints (packed and written chunk by chunk).
+        typecode (str): 'i' for int32 or 'q' for int64.
+
+    Returns:
+        int: Number of integers written.
+    """
+    buffer_format = getattr(values, "typecode", None) or getattr(values, "format", None)
+    with open(path, "wb") as file:
+        if isinstance(values, (array, memoryview)) and buffer_format == typecode:
+            file.write(memoryview(values).cast("B"))
+            return len(values)
+
+        count = 0
+        for start in range(0, len(values), chunk_size):
+            chunk = array(typecode, values[start:start + chunk_size])
+            chunk.tofile(file)
+            count += len(chunk)
+        return count
+
+
+def copy_buffer(view):
+    """
+    Returns an independent in-memory copy of an integer memoryview, still as a memoryview
+    (a single buffer copy, no conversion to Python ints).
+    """
+    return memoryview(bytearray(view.cast("B"))).cast(view.format)
+
+
+def sort_file(path, sort_function, typecode="q"):
+    """
+    Sorts a packed integer file in place through a writable mapping.
+
+    In-place algorithms write straight into the mapping; algorithms that return a new
+    list (such as quick_sort) have their result copied back over it.
+
+    Returns:
+        float: Seconds spent sorting (including the write-back).
+    """
+    with MappedIntArray(path, typecode, writable=True) as view:
+        start_time = time.perf_counter()
+        result = sort_function(view)
+        if result is not None and result is not view:
+            view[:] = array(typecode, result)
+        return time.perf_counter() - start_time
@@ -0,0 +1,117 @@
+"""
+data_generation.py
+
+Seeded, chunked generation of large integer benchmark datasets.
+
+Data is produced a chunk at a time into compact array('q') buffers (8 bytes per value)
+instead of one Python list, and can be streamed straight to a binary file. Datasets are
+cached on disk under a name derived from their parameters, so repeated benchmark runs
+with the same size, range and seed load the file instead of regenerating it.
+"""
+
+import os
+import random
+import time
+from array import array
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataset_cache")
+TYPECODE = "q"
+
+
+def iter_random_chunks(size, min_val, max_val, seed=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yields array('q') chunks of random integers in [min_val, max_val].
+
+    Parameters:
+        size (int): Total number of values to produce.
+        min_val (int): Minimum possible value.
+        max_val (int): Maximum possible value.
+        seed (int): Seed; the same seed always yields the same values.
+        chunk_size (int): Number of values per chunk.
+    """
+    rng = random.Random(seed)
+    # choices() on a range draws a whole chunk in one C-level call
+    values = range(min_val, max_val + 1)
+    remaining = size
+    while remaining > 0:
+        count = min(chunk_size, remaining)
+        yield array(TYPECODE, rng.choices(values, k=count))
+        remaining -= count
+
+
+def generate_array(size, min_val, max_val, seed=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Returns an array('q') of seeded random integers, built chunk by chunk.
+    """
+    data = array(TYPECODE)
+    for chunk in iter_random_chunks(size, min_val, max_val, seed, chunk_size):
+        data.extend(chunk)
+    return data
+
+
+def write_chunks(path, chunks):
+    """
+    Streams array chunks to a binary file, writing to a temporary file first so a
+    half-written dataset is never left under the final name.
+
+    Returns:
+        int: Number of values written.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    with open(temp_path, "wb") as file:
+        for chunk in chunks:
+            chunk.tofile(file)
+            count += len(chunk)
+    os.replace(temp_path, path)
+    return count
+
+
+def read_array(path):
+    """
+    Loads a binary file written by write_chunks into an array('q').
+    """
+    data = array(TYPECODE)
+    with open(path, "rb") as file:
+        data.frombytes(file.read())
+    return data
+
+
+def dataset_path(name, size, min_val, max_val, seed, cache_dir=DEFAULT_CACHE_DIR):
+    return os.path.join(cache_dir, f"{name}_n{size}_{min_val}_{max_val}_s{seed}.bin")
+
+
+def cached_dataset(name, size, min_val, max_val, seed, build=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Returns a dataset from the disk cache, generating and caching it on a miss.
+
+    Parameters:
+        name (str): Dataset kind (e.g. the distribution name), part of the cache key.
+        size (int): Number of values.
+        min_val (int): Minimum possible value.
+        max_val (int): Maximum possible value.
+        seed (int): Generation seed.
+        build (function): Called with no arguments on a miss; returns an array('q').
+            Defaults to streaming seeded random chunks straight to the cache file.
+        cache_dir (str): Directory holding cached datasets.
+
+    Returns:
+        tuple: (array('q'), seconds spent generating or loading, True if it came from the cache)
+    """
+    path = dataset_path(name, size, min_val, max_val, seed, cache_dir)
+    start_time = time.perf_counter()
+    if os.path.exists(path):
+        data = read_array(path)
+        return data, time.perf_counter() - start_time, True
+
+    if build is None:
+        write_chunks(path, iter_random_chunks(size, min_val, max_val, seed))
+        data = read_array(path)
+    else:
+        data = build()
+        write_chunks(path, [data])
+    return data, time.perf_counter() - start_time, False
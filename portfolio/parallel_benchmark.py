@@ -0,0 +1,218 @@
+"""
+parallel_benchmark.py
+
+Runs the comparator's benchmark matrix across several processes.
+
+Every (algorithm, distribution, size, run) cell is independent, so the cells are handed
+out to worker processes, one per available core. Each worker is pinned to its own core
+with os.sched_setaffinity (where the platform supports it) to keep timing noise low.
+The timed sort excludes input generation, which is reported separately.
+A cell's timeout starts once its worker reports that the input is loaded, so process
+startup and input generation never count against it. A cell that sorts past the timeout
+is killed and recorded as a timeout, and any larger size of the same algorithm and
+distribution is recorded as a timeout without being started, since it cannot finish faster.
+"""
+
+import os
+import statistics
+import time
+from collections import deque, namedtuple
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+
+BenchmarkCell = namedtuple("BenchmarkCell", ["algorithm", "distribution", "size", "run"])
+
+
+def available_cores():
+    """
+    Returns the list of CPU cores this process is allowed to run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_to_core(core):
+    if core is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {core})
+        except OSError:
+            # The core may have been taken away from us (cgroups); run unpinned
+            pass
+
+
+def _run_cell(cell, core, conn, sort_function, load_input):
+    """
+    Worker entry point: load the cell's input, time one sort and report back.
+    Sends ("loaded", generation seconds) before sorting, then ("done", sort seconds).
+    """
+    _pin_to_core(core)
+    data, generation_seconds = load_input(cell.distribution, cell.size)
+    conn.send(("loaded", generation_seconds))
+    start_time = time.perf_counter()
+    sort_function(data)
+    end_time = time.perf_counter()
+    conn.send(("done", end_time - start_time))
+    conn.close()
+
+
+def _result(cell, status, seconds=None, generation_seconds=None):
+    return {
+        "algorithm": cell.algorithm,
+        "distribution": cell.distribution,
+        "size": cell.size,
+        "run": cell.run,
+        "status": status,
+        "seconds": seconds,
+        "generation_seconds": generation_seconds,
+    }
+
+
+def build_cells(algorithms, distributions, sizes, num_runs):
+    """
+    Lists every benchmark cell, smallest sizes first so hopeless sizes can be skipped early.
+    """
+    return [
+        BenchmarkCell(algorithm, distribution, size, run)
+        for size in sorted(sizes)
+        for distribution in distributions
+        for algorithm in algorithms
+        for run in range(num_runs)
+    ]
+
+
+def run_cells(cells, algorithms, load_input, workers=None, timeout=None):
+    """
+    Runs benchmark cells on a pool of pinned worker processes.
+
+    Parameters:
+        cells (list): BenchmarkCell entries to run.
+        algorithms (dict): Maps algorithm name to its sorting function.
+        load_input (function): Called as load_input(distribution, size) inside the worker;
+            returns (list, generation seconds). It must be picklable (a module-level
+            function or functools.partial) and seeded so every run sees the same input.
+        workers (int): Number of worker processes (defaults to one per available core);
+            workers beyond the number of available cores run unpinned.
+        timeout (float): Seconds a single cell may sort, counted from when its input is
+            loaded, before it is killed (None for no limit).
+
+    Returns:
+        list: One result dict per cell with status "ok", "timeout" or "error".
+    """
+    cores = available_cores()
+    if workers and workers > len(cores):
+        # Pinning two workers to one core would add the noise pinning is meant to remove
+        extra = workers - len(cores)
+        print(f"Warning: {workers} workers but only {len(cores)} cores available; "
+              f"{extra} worker(s) will run unpinned.")
+        cores = [None] * extra + cores  # free_cores.pop() hands out the pinned cores first
+    elif workers:
+        cores = cores[:workers]
+    free_cores = list(cores)
+
+    pending = deque(cells)
+    running = {}
+    timed_out = {}
+    results = []
+
+    while pending or running:
+        # Start as many cells as there are free cores
+        while pending and free_cores:
+            cell = pending.popleft()
+            limit = timed_out.get((cell.algorithm, cell.distribution))
+            if limit is not None and cell.size >= limit:
+                results.append(_result(cell, "timeout"))
+                continue
+            core = free_cores.pop()
+            parent_conn, child_conn = Pipe(duplex=False)
+            process = Process(
+                target=_run_cell,
+                args=(cell, core, child_conn, algorithms[cell.algorithm], load_input),
+            )
+            process.start()
+            child_conn.close()
+            # [process, cell, core, deadline, generation seconds]; the deadline is set on "loaded"
+            running[parent_conn] = [process, cell, core, None, None]
+
+        if not running:
+            continue
+
+        deadlines = [entry[3] for entry in running.values() if entry[3] is not None]
+        wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+        for conn in wait(list(running), timeout=wait_time):
+            entry = running[conn]
+            process, cell, core, _, generation_seconds = entry
+            try:
+                message, seconds = conn.recv()
+            except EOFError:
+                # The worker died without reporting (e.g. out of memory)
+                message = "error"
+            if message == "loaded":
+                entry[3] = time.monotonic() + timeout if timeout else None
+                entry[4] = seconds
+                continue
+            del running[conn]
+            if message == "done":
+                results.append(_result(cell, "ok", seconds, generation_seconds))
+            else:
+                results.append(_result(cell, "error", generation_seconds=generation_seconds))
+            conn.close()
+            process.join()
+            free_cores.append(core)
+
+        now = time.monotonic()
+        for conn, (process, cell, core, deadline, generation_seconds) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                process.terminate()
+                process.join()
+                conn.close()
+                del running[conn]
+                free_cores.append(core)
+                results.append(_result(cell, "timeout", generation_seconds=generation_seconds))
+                key = (cell.algorithm, cell.distribution)
+                timed_out[key] = min(cell.size, timed_out.get(key, cell.size))
+
+    return results
+
+
+def summarize(results):
+    """
+    Groups cell results into per-(algorithm, distribution, size) statistics.
+
+    Returns:
+        dict: Maps (algorithm, distribution) to {size: (avg, std)}, where avg and std
+        are None when any run of that size timed out or failed (averaging only the runs
+        that finished would report the faster ones).
+    """
+    grouped = {}
+    for result in results:
+        key = (result["algorithm"], result["distribution"])
+        times = grouped.setdefault(key, {}).setdefault(result["size"], [])
+        times.append(result["seconds"] if result["status"] == "ok" else None)
+
+    summary = {}
+    for key, by_size in grouped.items():
+        summary[key] = {}
+        for size, times in by_size.items():
+            if None in times:
+                summary[key][size] = (None, None)
+            else:
+                std_time = statistics.stdev(times) if len(times) > 1 else 0.0
+                summary[key][size] = (statistics.mean(times), std_time)
+    return summary
+
+
+def summarize_generation(results):
+    """
+    Averages the input generation (or cache load) time the workers reported.
+
+    Returns:
+        dict: Maps (distribution, size) to mean generation seconds.
+    """
+    grouped = {}
+    for result in results:
+        if result["generation_seconds"] is not None:
+            key = (result["distribution"], result["size"])
+            grouped.setdefault(key, []).append(result["generation_seconds"])
+    return {key: statistics.mean(times) for key, times in sorted(grouped.items())}
@@ -0,0 +1,139 @@
+"""
+plotting.py
+
+Headless plotting helpers for the sorting comparators.
+
+matplotlib is only imported the first time a chart is requested, and it is
+always switched to the non-interactive Agg backend, so the comparators start
+quickly and run on machines without a display. Charts are written to PNG or
+SVG files instead of being shown in a window.
+"""
+
+import os
+
+SUPPORTED_FORMATS = ("png", "svg")
+
+_pyplot = None
+_pyplot_missing = False
+
+
+def _load_pyplot():
+    """
+    Imports matplotlib on first use and selects the Agg backend.
+
+    Returns:
+        module: matplotlib.pyplot, or None if matplotlib is not installed.
+    """
+    global _pyplot, _pyplot_missing
+    if _pyplot is None and not _pyplot_missing:
+        try:
+            import matplotlib
+        except ImportError:
+            _pyplot_missing = True
+            print("matplotlib is not installed; skipping charts.")
+            return None
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+
+def _check_format(file_format):
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported chart format '{file_format}', expected one of {SUPPORTED_FORMATS}")
+
+
+def chart_path(path):
+    """
+    argparse type for a chart file argument, so an unsupported extension is rejected
+    before the benchmark runs rather than after it.
+    """
+    from argparse import ArgumentTypeError
+    try:
+        _check_format(os.path.splitext(path)[1].lstrip(".").lower())
+    except ValueError as error:
+        raise ArgumentTypeError(str(error)) from None
+    return path
+
+
+def save_bar_chart(results, path, title="Execution Time Comparison of Sorting Algorithms",
+                   ylabel="Execution Time (seconds)"):
+    """
+    Writes a bar chart of one timing per algorithm to a file.
+
+    Parameters:
+        results (dict): Maps algorithm name to its execution time in seconds.
+        path (str): Output file; the extension picks PNG or SVG. Its directory is created
+            if missing.
+        title (str): Chart title.
+        ylabel (str): Label for the y-axis.
+
+    Returns:
+        str: The path written, or None if matplotlib is unavailable.
+    """
+    _check_format(os.path.splitext(path)[1].lstrip(".").lower())
+    plt = _load_pyplot()
+    if plt is None:
+        return None
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.bar(list(results.keys()), list(results.values()), color='skyblue')
+    ax.set_xlabel("Sorting Algorithms")
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+    return path
+
+
+def save_scaling_curves(curves, output_dir, file_format="png"):
+    """
+    Writes one log-log time-vs-n chart per input distribution.
+
+    Parameters:
+        curves (dict): Maps (algorithm, distribution) to a dict of {n: seconds}.
+        output_dir (str): Directory the charts are written to (created if missing).
+        file_format (str): "png" or "svg".
+
+    Returns:
+        list: The paths written (empty if matplotlib is unavailable).
+    """
+    _check_format(file_format)
+    plt = _load_pyplot()
+    if plt is None:
+        return []
+
+    os.makedirs(output_dir, exist_ok=True)
+    distributions = sorted({distribution for _, distribution in curves})
+    written = []
+
+    for distribution in distributions:
+        fig, ax = plt.subplots(figsize=(10, 6))
+        for (algorithm, curve_distribution), timings in curves.items():
+            if curve_distribution != distribution:
+                continue
+            # Timed-out or skipped cells have no timing and are left off the curve
+            points = sorted((n, t) for n, t in timings.items() if t is not None and t > 0)
+            if not points:
+                continue
+            sizes, times = zip(*points)
+            ax.plot(sizes, times, marker="o", label=algorithm)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Input size n")
+        ax.set_ylabel("Average Execution Time (seconds)")
+        ax.set_title(f"Scaling of Sorting Algorithms ({distribution} input)")
+        ax.grid(True, which="both", linestyle=":", linewidth=0.5)
+        ax.legend()
+        fig.tight_layout()
+
+        path = os.path.join(output_dir, f"scaling_{distribution}.{file_format}")
+        fig.savefig(path)
+        plt.close(fig)
+        written.append(path)
+
+    return written
@@ -0,0 +1,147 @@
+"""
+sample_sort.py
+
+Parallel sample sort on a single machine, with worker processes standing in for nodes.
+
+1. Sampling:     draw a random sample, sort it and pick p - 1 evenly spaced splitters.
+2. Partitioning: one pass over the data sends each element to the bucket between its
+                 splitters (bisect), giving p buckets whose ranges do not overlap.
+3. Local sort:   each bucket is sorted on its own worker with any algorithm from the
+                 comparator's registry (SORTING_ALGORITHMS).
+4. Gather:       because bucket i only holds values <= those in bucket i + 1, the result is
+                 the sorted buckets placed end to end; there is no final merge.
+
+The report gives the time of each phase and the load balance: bucket skew is the largest
+bucket divided by the mean bucket size (1.0 is perfectly balanced). local_sort is the
+slowest worker's sort time, measured inside the worker; transfer is the rest of the parallel
+step (sending buckets to the workers and the sorted buckets back). Starting the worker
+processes is reported separately (pool_startup) and is not part of the phase total.
+"""
+
+import random
+import time
+from bisect import bisect_right
+from multiprocessing import Pool
+
+
+def _sort_bucket(sort_function, bucket):
+    # Worker entry point; some algorithms sort in place, others return a new list.
+    # The sort is timed inside the worker so pickling the bucket is not counted as sorting.
+    start_time = time.perf_counter()
+    result = sort_function(bucket)
+    return result, time.perf_counter() - start_time
+
+
+def choose_splitters(data, buckets, oversample, rng):
+    """
+    Returns buckets - 1 splitters taken at regular intervals from a sorted random sample.
+    """
+    sample_size = min(len(data), buckets * oversample)
+    sample = sorted(rng.sample(data, sample_size))
+    step = sample_size / buckets
+    return [sample[int(step * i)] for i in range(1, buckets)]
+
+
+def partition(data, splitters):
+    """
+    Distributes data into len(splitters) + 1 buckets in a single pass.
+    """
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    appenders = [bucket.append for bucket in buckets]
+    for value in data:
+        appenders[bisect_right(splitters, value)](value)
+    return buckets
+
+
+def sample_sort(data, sort_function, workers=4, oversample=32, seed=0):
+    """
+    Sorts data with a parallel sample sort.
+
+    Parameters:
+        data (list): The values to sort (not modified).
+        sort_function (function): Registry algorithm used to sort each bucket; it must be
+            picklable (a module-level function).
+        workers (int): Number of buckets and worker processes.
+        oversample (int): Sample elements drawn per bucket; more gives better balance.
+        seed (int): Seed for the splitter sample.
+
+    Returns:
+        tuple: (sorted list, report dict with per-phase seconds, pool startup seconds,
+               bucket sizes and skew)
+    """
+    report = {"workers": workers, "phases": {}}
+    if len(data) <= 1 or workers <= 1:
+        start_time = time.perf_counter()
+        result = sort_function(list(data))
+        report["phases"]["local_sort"] = time.perf_counter() - start_time
+        report["bucket_sizes"] = [len(data)]
+        report["skew"] = 1.0
+        return result, report
+
+    start_time = time.perf_counter()
+    splitters = choose_splitters(data, workers, oversample, random.Random(seed))
+    report["phases"]["sampling"] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    buckets = partition(data, splitters)
+    report["phases"]["partitioning"] = time.perf_counter() - start_time
+
+    # Worker startup is reported on its own, outside the phases of the sort
+    start_time = time.perf_counter()
+    with Pool(processes=workers) as pool:
+        report["pool_startup"] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        outcomes = pool.starmap(_sort_bucket, [(sort_function, bucket) for bucket in buckets])
+        parallel_time = time.perf_counter() - start_time
+    sorted_buckets = [bucket for bucket, _ in outcomes]
+    # The buckets sort concurrently, so the slowest one is the sort's share of the wall time;
+    # the rest is moving buckets to the workers and back (pickling and pipe transfer)
+    report["phases"]["local_sort"] = max(seconds for _, seconds in outcomes)
+    report["phases"]["transfer"] = max(0.0, parallel_time - report["phases"]["local_sort"])
+
+    start_time = time.perf_counter()
+    result = []
+    for bucket in sorted_buckets:
+        result.extend(bucket)
+    report["phases"]["gather"] = time.perf_counter() - start_time
+
+    sizes = [len(bucket) for bucket in buckets]
+    report["bucket_sizes"] = sizes
+    report["skew"] = max(sizes) / (len(data) / len(sizes))
+    return result, report
+
+
+def print_report(report, algorithm_name):
+    print(f"\nSample Sort ({report['workers']} workers, buckets sorted with {algorithm_name}):")
+    for phase, seconds in report["phases"].items():
+        print(f"  {phase:<14} {seconds:.6f} seconds")
+    print(f"  {'total':<14} {sum(report['phases'].values()):.6f} seconds")
+    if "pool_startup" in report:
+        print(f"  (starting {report['workers']} worker processes took {report['pool_startup']:.6f} seconds)")
+    sizes = report["bucket_sizes"]
+    print(f"  bucket sizes:  min {min(sizes)}, max {max(sizes)}, skew {report['skew']:.2f}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from sorting_comparator_v2 import SORTING_ALGORITHMS, generate_random_list
+
+    parser = argparse.ArgumentParser(description="Parallel sample sort over the comparator's algorithms")
+    parser.add_argument("--size", type=int, default=200000, help="Number of elements in the list")
+    parser.add_argument("--workers", type=int, default=4, help="Number of buckets / worker processes")
+    parser.add_argument("--algorithm", choices=sorted(SORTING_ALGORITHMS), default="Merge Sort",
+                        help="Algorithm used to sort each bucket")
+    args = parser.parse_args()
+
+    data = generate_random_list(args.size, 1, 10 * args.size)
+    sort_function = SORTING_ALGORITHMS[args.algorithm]
+
+    start_time = time.perf_counter()
+    serial = sort_function(list(data))
+    print(f"Serial {args.algorithm}: {time.perf_counter() - start_time:.6f} seconds")
+
+    result, report = sample_sort(data, sort_function, args.workers)
+    assert result == serial
+    print_report(report, args.algorithm)
@@ -0,0 +1,144 @@
+"""
+selection.py
+
+Partial sorting: find the k smallest elements without sorting everything.
+
+- nth_element: introselect. Quickselect with a median-of-three pivot and three-way
+  partitioning (so duplicates are cheap), falling back to median-of-medians pivots once
+  it has used up a 2*log2(n) partition budget, which bounds the worst case at O(n).
+- top_k: the k smallest elements in sorted order in O(n + k log k), by selecting the
+  k-th element and sorting only the part in front of it.
+- streaming_top_k: bounded heap of size k over any iterable (O(n log k) time, O(k) memory),
+  for input that is too large to hold or arrives as a stream.
+
+Every function takes an optional key, e.g. top_k(records, 10, key=lambda r: r["dob"]).
+"""
+
+import heapq
+
+
+def _identity(value):
+    return value
+
+
+def _partition(arr, low, high, pivot, key):
+    """
+    Three-way partition of arr[low..high] around the pivot value.
+
+    The three groups are built with list comprehensions (the filtering runs in C) and
+    written back over the segment, which is several times faster in Python than swapping
+    element by element.
+
+    Returns:
+        tuple: (lt, gt) such that keys in arr[low..lt-1] < pivot, arr[lt..gt] == pivot
+        and arr[gt+1..high] > pivot.
+    """
+    segment = arr[low:high + 1]
+    if key is _identity:
+        less = [x for x in segment if x < pivot]
+        equal = [x for x in segment if x == pivot]
+        greater = [x for x in segment if x > pivot]
+    else:
+        keyed = [(key(x), x) for x in segment]
+        less = [x for k, x in keyed if k < pivot]
+        equal = [x for k, x in keyed if k == pivot]
+        greater = [x for k, x in keyed if k > pivot]
+    arr[low:high + 1] = less + equal + greater
+    lt = low + len(less)
+    return lt, lt + len(equal) - 1
+
+
+def _median_of_three(a, b, c):
+    if a < b:
+        if b < c:
+            return b
+        return c if a < c else a
+    if a < c:
+        return a
+    return c if b < c else b
+
+
+def _median_of_medians(values, k):
+    """
+    Deterministic linear-time selection of the k-th smallest of a list of keys.
+    """
+    while True:
+        if len(values) <= 5:
+            return sorted(values)[k]
+        medians = []
+        for i in range(0, len(values), 5):
+            group = sorted(values[i:i + 5])
+            medians.append(group[(len(group) - 1) // 2])
+        pivot = _median_of_medians(medians, len(medians) // 2)
+
+        lows = [value for value in values if value < pivot]
+        highs = [value for value in values if value > pivot]
+        equal_count = len(values) - len(lows) - len(highs)
+        if k < len(lows):
+            values = lows
+        elif k < len(lows) + equal_count:
+            return pivot
+        else:
+            k -= len(lows) + equal_count
+            values = highs
+
+
+def nth_element(arr, k, key=None):
+    """
+    Partially sorts arr in place so that arr[k] holds the element that would be there if arr
+    were fully sorted, everything before it is not greater and everything after is not smaller.
+
+    Parameters:
+        arr (list): The list to rearrange.
+        k (int): Zero-based rank to select.
+        key (function): Optional key function, as for sorted().
+
+    Returns:
+        The k-th smallest element.
+    """
+    n = len(arr)
+    if not 0 <= k < n:
+        raise IndexError(f"k = {k} is out of range for a list of {n} elements")
+    key = key or _identity
+
+    low, high = 0, n - 1
+    budget = 2 * n.bit_length()
+    while low < high:
+        if budget > 0:
+            budget -= 1
+            pivot = _median_of_three(key(arr[low]), key(arr[(low + high) // 2]), key(arr[high]))
+        else:
+            # Too many unbalanced partitions: switch to guaranteed-good pivots
+            pivot = _median_of_medians([key(x) for x in arr[low:high + 1]], (high - low) // 2)
+
+        lt, gt = _partition(arr, low, high, pivot, key)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            break
+    return arr[k]
+
+
+def top_k(arr, k, key=None):
+    """
+    Returns the k smallest elements of arr in sorted order (arr itself is not modified).
+    """
+    if k <= 0:
+        return []
+    if k >= len(arr):
+        return sorted(arr, key=key)
+    candidates = list(arr)
+    nth_element(candidates, k - 1, key)
+    return sorted(candidates[:k], key=key)
+
+
+def streaming_top_k(iterable, k, key=None):
+    """
+    Returns the k smallest items of any iterable in sorted order, holding at most k items
+    (heapq.nsmallest keeps a bounded heap of size k).
+    """
+    if k <= 0:
+        return []
+    return heapq.nsmallest(k, iterable, key=key)
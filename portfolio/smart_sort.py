@@ -0,0 +1,337 @@
+"""
+smart_sort.py
+
+Adaptive sorting: inspect a cheap sample of the input, then dispatch to the engine in the
+comparator's registry (SORTING_ALGORITHMS) that should be fastest for it.
+
+Features looked at (profile_input):
+  - size n and element type
+  - value range (full type check and exact min/max, only for integers; C-speed passes)
+  - presortedness: share of descents in a few contiguous windows (0 = sorted runs)
+  - duplicate ratio of an evenly spaced sample
+
+Decision order (choose_engine):
+  tiny input                      -> Insertion Sort
+  integers, range <= factor * n   -> Counting Sort
+  nearly sorted                   -> Natural Merge Sort (merges the existing runs)
+  very large n                    -> parallel Sample Sort with Intro Sort buckets
+  integers with a bounded range   -> Radix Sort
+  many duplicates                 -> Quick Sort (three-way partitioning)
+  anything else                   -> Intro Sort
+
+The numeric thresholds start from DEFAULT_THRESHOLDS and can be re-tuned from the
+comparator's own benchmark results (the 'sorting' experiment of run_experiments.py, which
+stores each input's profile_input features with its timings) with
+`python smart_sort.py --tune ../results/results.jsonl`, which writes smart_sort_thresholds.json.
+Large sizes only need the engines being compared, e.g. for parallel_min_size:
+
+    {"experiment": "sorting",
+     "grid": {"size": [1000000, 4000000], "algorithms": [["Intro Sort"]], "sample_sort_workers": 4}}
+"""
+
+import os
+from collections import namedtuple
+
+import _repo_path  # noqa: F401
+
+from algorithms import SORTING_ALGORITHMS
+from algorithms.sorting import COUNTING_MAX_RANGE_FACTOR, COUNTING_MIN_RANGE_ALLOWANCE
+
+SortDecision = namedtuple("SortDecision", ["engine", "reason", "features"])
+
+DEFAULT_THRESHOLDS = {
+    "small_n": 32,                         # at or below this, insertion sort
+    "counting_range_factor": 2.0,          # counting sort if value range <= factor * n
+    "nearly_sorted_descent_ratio": 0.05,   # natural merge sort at or below this share of descents
+    "parallel_min_size": 2_000_000,        # sample sort from this size on
+    "radix_max_bits": 32,                  # radix sort if the value range fits in this many bits
+    "duplicate_ratio": 0.5,                # three-way quick sort at or above this duplicate share
+}
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "smart_sort_thresholds.json")
+
+_thresholds = None
+
+
+def load_thresholds(path=THRESHOLDS_PATH):
+    """
+    Returns the default thresholds, overridden by any tuned values saved at path.
+    """
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    if os.path.exists(path):
+        import json  # json (and re) only load when there is a tuned file to read
+        with open(path, encoding="utf-8") as file:
+            thresholds.update(json.load(file))
+    return thresholds
+
+
+def _current_thresholds():
+    global _thresholds
+    if _thresholds is None:
+        _thresholds = load_thresholds()
+    return _thresholds
+
+
+# -----------------------------
+# Input profiling
+# -----------------------------
+
+def profile_input(arr, sample_size=1024, windows=4):
+    """
+    Measures the features choose_engine uses, touching only a sample of the input
+    (plus min/max for integer data).
+
+    Returns:
+        dict: n, element_type, is_int, min, max, value_range, descent_ratio, duplicate_ratio
+    """
+    n = len(arr)
+    features = {"n": n, "element_type": None, "is_int": False, "min": None, "max": None,
+                "value_range": None, "descent_ratio": 0.0, "duplicate_ratio": 0.0}
+    if n == 0:
+        return features
+
+    step = max(1, n // sample_size)
+    sample = [arr[i] for i in range(0, n, step)]
+
+    types = {type(value) for value in sample}
+    if types == {int}:
+        # Counting and radix sort index and shift by value, so every element must be an int,
+        # not just the sampled ones; checking the full input is another C-speed pass
+        types = set(map(type, arr))
+    features["element_type"] = types.pop().__name__ if len(types) == 1 else "mixed"
+    features["is_int"] = features["element_type"] == "int"
+    if features["is_int"]:
+        features["min"] = min(arr)
+        features["max"] = max(arr)
+        features["value_range"] = features["max"] - features["min"] + 1
+
+    # Presortedness from contiguous windows spread over the input
+    descents = comparisons = 0
+    if n >= 2:
+        window = max(2, min(n, sample_size // windows))
+        for w in range(windows):
+            start = (n - window) * w // max(1, windows - 1)
+            for i in range(start + 1, start + window):
+                comparisons += 1
+                if arr[i] < arr[i - 1]:
+                    descents += 1
+    features["descent_ratio"] = descents / comparisons if comparisons else 0.0
+
+    try:
+        features["duplicate_ratio"] = 1 - len(set(sample)) / len(sample)
+    except TypeError:
+        # unhashable elements: duplicates cannot be counted cheaply
+        pass
+    return features
+
+
+def choose_engine(arr, thresholds=None):
+    """
+    Picks the engine for arr and explains why.
+
+    Returns:
+        SortDecision: (engine name, human-readable reason, features dict)
+    """
+    thresholds = thresholds or _current_thresholds()
+    f = profile_input(arr)
+    n = f["n"]
+
+    if n <= thresholds["small_n"]:
+        return SortDecision("Insertion Sort", f"n = {n} <= {thresholds['small_n']}", f)
+    if f["is_int"] and f["value_range"] <= thresholds["counting_range_factor"] * n:
+        return SortDecision("Counting Sort",
+                            f"integer range {f['value_range']} <= {thresholds['counting_range_factor']:g} * n", f)
+    if f["descent_ratio"] <= thresholds["nearly_sorted_descent_ratio"]:
+        return SortDecision("Natural Merge Sort",
+                            f"descent ratio {f['descent_ratio']:.3f} <= {thresholds['nearly_sorted_descent_ratio']}"
+                            " (nearly sorted)", f)
+    if n >= thresholds["parallel_min_size"]:
+        return SortDecision("Sample Sort", f"n = {n} >= {thresholds['parallel_min_size']}", f)
+    if f["is_int"] and f["value_range"].bit_length() <= thresholds["radix_max_bits"]:
+        return SortDecision("Radix Sort",
+                            f"integers spanning {f['value_range'].bit_length()} bits <= {thresholds['radix_max_bits']}", f)
+    if f["duplicate_ratio"] >= thresholds["duplicate_ratio"]:
+        return SortDecision("Quick Sort",
+                            f"duplicate ratio {f['duplicate_ratio']:.2f} >= {thresholds['duplicate_ratio']}", f)
+    return SortDecision("Intro Sort", "no special structure detected", f)
+
+
+def smart_sort(arr, thresholds=None, workers=None, explain=False):
+    """
+    Sorts arr in place with the engine choose_engine picks.
+
+    Parameters:
+        arr (list): The list to sort.
+        thresholds (dict): Decision thresholds (defaults to the tuned or default ones).
+        workers (int): Worker processes for the parallel path (defaults to the core count).
+        explain (bool): Also return the SortDecision.
+
+    Returns:
+        list, or (list, SortDecision) when explain is True.
+    """
+    decision = choose_engine(arr, thresholds)
+    if decision.engine == "Sample Sort":
+        import sample_sort  # multiprocessing is only loaded for inputs this large
+        workers = workers or os.cpu_count() or 1
+        result, _ = sample_sort.sample_sort(arr, SORTING_ALGORITHMS["Intro Sort"], workers)
+        arr[:] = result
+    else:
+        result = SORTING_ALGORITHMS[decision.engine](arr)
+        if result is not arr:
+            arr[:] = result
+    return (arr, decision) if explain else arr
+
+
+# -----------------------------
+# Tuning from benchmark results
+# -----------------------------
+
+def load_benchmark_records(path):
+    """
+    Reads the 'sorting' experiment records from a results store file (JSON Lines).
+    """
+    import json
+    records = []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                if record["experiment"] == "sorting" and "algorithms" in record["result"]:
+                    records.append(record)
+    return records
+
+
+def _fastest(record):
+    timings = {name: entry["avg"] for name, entry in record["result"]["algorithms"].items()}
+    return min(timings, key=timings.get)
+
+
+def _boundary(wins, losses, current):
+    """
+    Places a threshold between the largest winning value and the smallest loss above it.
+    With no loss above the wins, the threshold only grows (to the largest win).
+    """
+    if not wins:
+        return current
+    best = max(wins)
+    above = [value for value in losses if value > best]
+    if above:
+        return (best + min(above)) / 2
+    return max(current, best)
+
+
+def _beats_intro_sort(record, engine):
+    """
+    True/False when engine was faster/slower than Intro Sort in the record (None if either
+    was not measured). Intro Sort is what choose_engine falls back to, so a special case only
+    pays off where its engine beats it.
+    """
+    measured = record["result"]["algorithms"]
+    if engine not in measured or "Intro Sort" not in measured:
+        return None
+    return measured[engine]["avg"] < measured["Intro Sort"]["avg"]
+
+
+def tune_thresholds(records, thresholds=None):
+    """
+    Moves thresholds to where the measured winners actually changed.
+
+    - small_n: between the random-input sizes Insertion Sort won and lost
+    - counting_range_factor: between the (value range / n) ratios Counting Sort won and lost
+    - parallel_min_size: smallest size at which Sample Sort was fastest
+    - nearly_sorted_descent_ratio, radix_max_bits, duplicate_ratio: between the descent
+      ratios, value range bit lengths and duplicate ratios at which Natural Merge Sort,
+      Radix Sort and Quick Sort beat and lost to Intro Sort (from the nearly_sorted and
+      few_unique inputs among others; records without stored features are skipped)
+
+    Only records in which an engine was measured count towards its threshold, and
+    thresholds with no supporting measurements keep their current values.
+    """
+    tuned = dict(thresholds or load_thresholds())
+    insertion = ([], [])
+    counting = ([], [])
+    parallel_sizes = []
+    nearly_sorted = ([], [])
+    radix = ([], [])
+    duplicates = ([], [])
+
+    for record in records:
+        params = record["params"]
+        measured = record["result"]["algorithms"]
+        winner = _fastest(record)
+        size = params["size"]
+        distribution = params.get("distribution", "random")
+        if "Insertion Sort" in measured and distribution == "random":
+            insertion[winner != "Insertion Sort"].append(size)
+        value_range = params.get("max_val", 10000) - params.get("min_val", 1) + 1
+        if ("Counting Sort" in measured and distribution == "random"
+                and value_range <= COUNTING_MAX_RANGE_FACTOR * size + COUNTING_MIN_RANGE_ALLOWANCE):
+            # (wider ranges were timed on counting_sort's radix fallback, not on counting sort)
+            counting[winner != "Counting Sort"].append(value_range / size)
+        if winner == "Sample Sort":
+            parallel_sizes.append(size)
+
+        features = record["result"].get("features")
+        if features is None:
+            continue
+        beats = _beats_intro_sort(record, "Natural Merge Sort")
+        if beats is not None:
+            nearly_sorted[not beats].append(features["descent_ratio"])
+        beats = _beats_intro_sort(record, "Radix Sort")
+        if beats is not None and features["is_int"]:
+            radix[not beats].append(features["value_range"].bit_length())
+        beats = _beats_intro_sort(record, "Quick Sort")
+        if beats is not None:
+            # Quick Sort is chosen at or above the threshold, so the boundary is found on -ratio
+            duplicates[not beats].append(-features["duplicate_ratio"])
+
+    tuned["small_n"] = int(_boundary(*insertion, tuned["small_n"]))
+    tuned["counting_range_factor"] = _boundary(*counting, tuned["counting_range_factor"])
+    if parallel_sizes:
+        tuned["parallel_min_size"] = min(parallel_sizes)
+    tuned["nearly_sorted_descent_ratio"] = _boundary(*nearly_sorted, tuned["nearly_sorted_descent_ratio"])
+    tuned["radix_max_bits"] = int(_boundary(*radix, tuned["radix_max_bits"]))
+    tuned["duplicate_ratio"] = -_boundary(*duplicates, -tuned["duplicate_ratio"])
+    return tuned
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    import random
+    import time
+
+    parser = argparse.ArgumentParser(description="Adaptive sort engine selector")
+    parser.add_argument("--tune", metavar="RESULTS",
+                        help="Tune thresholds from a results store file and save them")
+    parser.add_argument("--size", type=int, default=100000, help="Input size for the demonstration")
+    args = parser.parse_args()
+
+    if args.tune:
+        tuned = tune_thresholds(load_benchmark_records(args.tune))
+        with open(THRESHOLDS_PATH, "w", encoding="utf-8") as file:
+            json.dump(tuned, file, indent=2)
+        print(f"Thresholds written to {THRESHOLDS_PATH}:")
+        for name, value in tuned.items():
+            print(f"  {name:<30} {value}")
+
+    n = args.size
+    nearly_sorted = list(range(n))
+    for _ in range(n // 1000):
+        i, j = random.randrange(n), random.randrange(n)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+    inputs = {
+        "small ints": [random.randrange(100) for _ in range(n)],
+        "wide ints": [random.randrange(10 ** 12) for _ in range(n)],
+        "nearly sorted": nearly_sorted,
+        "floats": [random.random() for _ in range(n)],
+        "few unique strings": [random.choice("abcdefgh") * 3 for _ in range(n)],
+    }
+
+    for name, data in inputs.items():
+        start = time.perf_counter()
+        result, decision = smart_sort(list(data), explain=True)
+        elapsed = time.perf_counter() - start
+        assert result == sorted(data)
+        print(f"{name:<20} -> {decision.engine:<20} ({decision.reason}) {elapsed:.4f} seconds")
@@ -3,121 +3,220 @@
 sorting_comparator_v2.py
 
 This script compares the performance of various sorting algorithms.
-It implements core algorithms (Bubble Sort, Merge Sort, Quick Sort, Insertion Sort, Heap Sort)
-with input customization via command-line arguments, and displays the comparative results in both
+It benchmarks the algorithms of the shared algorithms package (Bubble Sort, Merge Sort, Quick Sort,
+Insertion Sort, Heap Sort, Radix Sort, Counting Sort, Natural Merge Sort, Intro Sort) with input
+customization via command-line arguments, and displays the comparative results in both
 tabular and bar chart formats. Additionally, it outputs recommendations for further analysis.
+
+Charts are written to files (see plotting.py) rather than shown, so the script also runs on
+headless machines. Passing --sizes runs a sweep over several input sizes and distributions and
+writes a log-log time-vs-n chart per distribution. Passing --workers spreads the benchmark
+cells over pinned worker processes with an optional per-cell --timeout (see parallel_benchmark.py).
+Inputs are seeded (--seed) and, with --cache_dir, generated once and reused from disk across runs
+(see data_generation.py); generation time is reported separately from sort time.
+With --input_file the benchmark runs directly over a memory-mapped binary integer file (see
+binary_io.py), and --write_sorted sorts that file in place through the mapping.
+--select_k compares top-k selection (selection.py) against full sorts for several k.
+--sample_sort runs a parallel sample sort whose buckets are sorted with a registry algorithm
+(see sample_sort.py) and reports its per-phase times and bucket skew.
+smart_sort.py picks one of these engines per input from a cheap profile of the data.
+--profile records a sampling CPU profile of the run as flamegraph-ready collapsed stacks
+(see algorithms/profiler.py).
 """
 
 import time
 import random
 import argparse
-import copy
+import functools
+import os
 import statistics
-import matplotlib.pyplot as plt
 
-# -----------------------------
-# Sorting Algorithms
-# -----------------------------
+import _repo_path  # noqa: F401
 
-def bubble_sort(arr):
-    number_of_elements = len(arr)
-    for i in range(number_of_elements):
-        has_swapped = False
-        for j in range(0, number_of_elements - i - 1):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                has_swapped = True
-        if not has_swapped:
-            break
-    return arr
-
-def merge_sort(arr):
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        left_half = arr[:mid]
-        right_half = arr[mid:]
-        merge_sort(left_half)
-        merge_sort(right_half)
-        i = j = k = 0
-        while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
-                arr[k] = left_half[i]
-                i += 1
-            else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
-        while i < len(left_half):
-            arr[k] = left_half[i]
-            i += 1
-            k += 1
-        while j < len(right_half):
-            arr[k] = right_half[j]
-            j += 1
-            k += 1
-    return arr
-
-def quick_sort(arr):
-    if len(arr) <= 1:
-        return arr
-    pivot = arr[len(arr) // 2]
-    less = [x for x in arr if x < pivot]
-    equal = [x for x in arr if x == pivot]
-    greater = [x for x in arr if x > pivot]
-    return quick_sort(less) + equal + quick_sort(greater)
-
-def insertion_sort(arr):
-    for i in range(1, len(arr)):
-        key = arr[i]
-        j = i - 1
-        while j >= 0 and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-    return arr
-
-def heapify(arr, n, i):
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
-
-def heap_sort(arr):
-    n = len(arr)
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
-    for i in range(n - 1, 0, -1):
-        arr[0], arr[i] = arr[i], arr[0]
-        heapify(arr, i, 0)
-    return arr
+import binary_io
+import data_generation
+import plotting
+import selection
+from algorithms import SORTING_ALGORITHMS
+from algorithms.profile_cli import add_profile_arguments, finish_profile, profiler_from_args
+
+# The sorting algorithms live in the algorithms package (algorithms/sorting.py) and are
+# imported on first use through its registry. parallel_benchmark and sample_sort pull in
+# multiprocessing, so they are only imported by the options that need them.
 
 # -----------------------------
 # Utility Functions
 # -----------------------------
 
-def generate_random_list(size, min_val, max_val):
-    return [random.randint(min_val, max_val) for _ in range(size)]
+def generate_random_list(size, min_val, max_val, rng=random):
+    return rng.choices(range(min_val, max_val + 1), k=size)
+
+def generate_sorted_list(size, min_val, max_val, rng=random):
+    return sorted(generate_random_list(size, min_val, max_val, rng))
+
+def generate_reversed_list(size, min_val, max_val, rng=random):
+    return sorted(generate_random_list(size, min_val, max_val, rng), reverse=True)
+
+def generate_nearly_sorted_list(size, min_val, max_val, rng=random):
+    # Sorted data with roughly 1% of positions swapped at random
+    data = generate_sorted_list(size, min_val, max_val, rng)
+    for _ in range(max(1, size // 100) if size > 1 else 0):
+        i = rng.randrange(size)
+        j = rng.randrange(size)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+def generate_few_unique_list(size, min_val, max_val, rng=random):
+    values = [rng.randint(min_val, max_val) for _ in range(10)]
+    return [rng.choice(values) for _ in range(size)]
+
+DISTRIBUTIONS = {
+    "random": generate_random_list,
+    "sorted": generate_sorted_list,
+    "reversed": generate_reversed_list,
+    "nearly_sorted": generate_nearly_sorted_list,
+    "few_unique": generate_few_unique_list,
+}
+
+def load_input(distribution, size, min_val, max_val, seed=0, cache_dir=None):
+    """
+    Builds a seeded input list, reusing the on-disk dataset cache when cache_dir is given.
+
+    Returns:
+        tuple: (list, seconds spent generating or loading the data)
+    """
+    if distribution == "random":
+        # Random data is streamed chunk by chunk (straight into the cache file on a miss)
+        build = None
+    else:
+        def build():
+            # A private generator, so loading input leaves the global random state alone
+            rng = random.Random(f"{seed}-{distribution}-{size}")
+            return data_generation.array(data_generation.TYPECODE,
+                                         DISTRIBUTIONS[distribution](size, min_val, max_val, rng))
+
+    if cache_dir is None:
+        start_time = time.perf_counter()
+        data = data_generation.generate_array(size, min_val, max_val, seed) if build is None else build()
+        elapsed = time.perf_counter() - start_time
+    else:
+        data, elapsed, _ = data_generation.cached_dataset(distribution, size, min_val, max_val, seed,
+                                                          build, cache_dir)
+    return data.tolist(), elapsed
 
 def measure_sorting_time(sort_function, arr):
-    arr_copy = copy.deepcopy(arr)
+    if isinstance(arr, memoryview):
+        # Memory-mapped input: one buffer copy so the sort runs over a buffer too
+        arr_copy = binary_io.copy_buffer(arr)
+    else:
+        arr_copy = list(arr)
     start_time = time.perf_counter()
     sort_function(arr_copy)
     end_time = time.perf_counter()
     return end_time - start_time
 
-def display_table(results):
-    print("\nExecution Times (averages over 20 runs):")
+def time_algorithm(func, data, num_runs):
+    times = [measure_sorting_time(func, data) for _ in range(num_runs)]
+    avg_time = statistics.mean(times)
+    std_time = statistics.stdev(times) if num_runs > 1 else 0.0
+    return avg_time, std_time
+
+def run_scaling_sweep(sizes, distributions, num_runs, min_val, max_val, seed=0, cache_dir=None):
+    """
+    Times every algorithm on every (size, distribution) pair.
+
+    Returns a dict mapping (algorithm, distribution) to {size: average seconds}.
+    """
+    curves = {}
+    for distribution in distributions:
+        for size in sizes:
+            data, generation_time = load_input(distribution, size, min_val, max_val, seed, cache_dir)
+            print(f"{'Data generation':<15} {distribution:<14} n={size:<9} {generation_time:.6f} seconds")
+            for name, func in SORTING_ALGORITHMS.items():
+                avg_time, _ = time_algorithm(func, data, num_runs)
+                curves.setdefault((name, distribution), {})[size] = avg_time
+                print(f"{name:<15} {distribution:<14} n={size:<9} {avg_time:.6f} seconds")
+    return curves
+
+def run_parallel_benchmark(sizes, distributions, num_runs, min_val, max_val, workers, timeout, seed,
+                           cache_dir=None):
+    """
+    Runs the benchmark matrix on worker processes.
+
+    Returns a dict mapping (algorithm, distribution) to {size: (avg, std)}; entries where
+    any run timed out or failed are (None, None).
+    """
+    import parallel_benchmark
+
+    if cache_dir is not None:
+        # Fill the cache up front so workers only load data instead of all generating it at once
+        for distribution in distributions:
+            for size in sizes:
+                _, generation_time = load_input(distribution, size, min_val, max_val, seed, cache_dir)
+                print(f"Data generation ({distribution}, n={size}): {generation_time:.6f} seconds")
+
+    cells = parallel_benchmark.build_cells(SORTING_ALGORITHMS, distributions, sizes, num_runs)
+    input_loader = functools.partial(load_input, min_val=min_val, max_val=max_val, seed=seed,
+                                     cache_dir=cache_dir)
+    start_time = time.perf_counter()
+    results = parallel_benchmark.run_cells(cells, SORTING_ALGORITHMS, input_loader,
+                                           workers=workers, timeout=timeout)
+    wall_time = time.perf_counter() - start_time
+    timeouts = sum(1 for result in results if result["status"] == "timeout")
+    errors = sum(1 for result in results if result["status"] == "error")
+    print(f"Ran {len(cells)} cells in {wall_time:.2f} seconds wall time "
+          f"({timeouts} timeouts, {errors} errors).")
+    for (distribution, size), generation_time in parallel_benchmark.summarize_generation(results).items():
+        print(f"Data generation in workers ({distribution}, n={size}): {generation_time:.6f} seconds (mean)")
+    return parallel_benchmark.summarize(results)
+
+def run_selection_comparison(data, ks, num_runs):
+    """
+    Times finding the k smallest elements by selection versus by sorting everything.
+
+    Returns a dict mapping method name to {k: average seconds}.
+    """
+    methods = {
+        "Quickselect top_k": lambda arr, k: selection.top_k(arr, k),
+        "Bounded heap top_k": lambda arr, k: selection.streaming_top_k(arr, k),
+        "Merge Sort + slice": lambda arr, k: SORTING_ALGORITHMS["Merge Sort"](arr)[:k],
+        "Built-in sorted + slice": lambda arr, k: sorted(arr)[:k],
+    }
+    expected = {k: sorted(data)[:k] for k in ks}
+    timings = {}
+    for name, method in methods.items():
+        timings[name] = {}
+        for k in ks:
+            times = []
+            for _ in range(num_runs):
+                arr_copy = list(data)
+                start_time = time.perf_counter()
+                result = method(arr_copy, k)
+                times.append(time.perf_counter() - start_time)
+            if result != expected[k]:
+                raise ValueError(f"{name} returned the wrong {k} smallest elements")
+            timings[name][k] = statistics.mean(times)
+    return timings
+
+def display_selection_table(timings, size):
+    ks = sorted(next(iter(timings.values())))
+    print(f"\nTop-k selection vs full sort (n = {size}, average seconds):")
+    header = "{:<25}".format("Method") + "".join("{:>12}".format(f"k={k}") for k in ks)
+    print(header)
+    print("-" * len(header))
+    for name, by_k in timings.items():
+        print("{:<25}".format(name) + "".join("{:>12.6f}".format(by_k[k]) for k in ks))
+
+def display_table(results, num_runs=20):
+    print(f"\nExecution Times (averages over {num_runs} runs):")
     header = "{:<25} {:>15} {:>15}".format("Algorithm", "Avg (sec)", "Std Dev")
     print(header)
     print("-" * len(header))
     for name, (avg, std) in results.items():
-        print("{:<25} {:>15.6f} {:>15.6f}".format(name, avg, std))
+        if avg is None:
+            print("{:<25} {:>15} {:>15}".format(name, "timeout", "-"))
+        else:
+            print("{:<25} {:>15.6f} {:>15.6f}".format(name, avg, std))
 
 # -----------------------------
 # Main Execution and Testing
@@ -128,44 +227,112 @@ def main():
     parser.add_argument("--size", type=int, default=1000, help="Number of elements in the list")
     parser.add_argument("--min_val", type=int, default=1, help="Minimum value for list elements")
     parser.add_argument("--max_val", type=int, default=10000, help="Maximum value for list elements")
+    parser.add_argument("--runs", type=int, default=20, help="Number of timed runs per algorithm")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        help="Also sweep these sizes and write log-log scaling curves")
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS), default=["random"],
+                        help="Input distributions used by the --sizes sweep")
+    parser.add_argument("--plot_dir", default="charts", help="Directory charts are written to")
+    parser.add_argument("--plot_format", choices=plotting.SUPPORTED_FORMATS, default="png",
+                        help="File format of the charts")
+    parser.add_argument("--no_plot", action="store_true", help="Skip chart generation entirely")
+    parser.add_argument("--workers", type=int,
+                        help="Run benchmark cells on this many pinned worker processes (0 = one per core)")
+    parser.add_argument("--timeout", type=float,
+                        help="Seconds a single parallel cell may run before it is recorded as a timeout")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for input generation")
+    parser.add_argument("--input_file", help="Benchmark a packed binary integer file (memory-mapped) "
+                                             "instead of generated data")
+    parser.add_argument("--typecode", choices=binary_io.TYPECODES, default="q",
+                        help="Integer type of --input_file: i = int32, q = int64")
+    parser.add_argument("--write_sorted", choices=sorted(SORTING_ALGORITHMS),
+                        help="After benchmarking, sort --input_file in place with this algorithm")
+    parser.add_argument("--select_k", type=int, nargs="+",
+                        help="Also compare top-k selection against full sorts for these k")
+    parser.add_argument("--sample_sort", choices=sorted(SORTING_ALGORITHMS),
+                        help="Also run a parallel sample sort whose buckets use this algorithm")
+    parser.add_argument("--sample_sort_workers", type=int, default=4,
+                        help="Buckets / worker processes for --sample_sort")
+    parser.add_argument("--cache_dir", nargs="?", const=data_generation.DEFAULT_CACHE_DIR,
+                        help="Reuse generated datasets from this directory (default: portfolio/.dataset_cache)")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    data = generate_random_list(args.size, args.min_val, args.max_val)
+    # Sampling profiler (off unless requested); with --workers only this process is sampled
+    profiler = profiler_from_args(args)
 
-    sorting_algorithms = {
-        "Bubble Sort": bubble_sort,
-        "Merge Sort": merge_sort,
-        "Quick Sort": quick_sort,
-        "Insertion Sort": insertion_sort,
-        "Heap Sort": heap_sort
-    }
+    num_runs = args.runs
+    curves = None
+
+    if args.workers is not None:
+        sizes = sorted(set(args.sizes or []) | {args.size})
+        distributions = sorted(set(args.distributions) | {"random"})
+        summary = run_parallel_benchmark(sizes, distributions, num_runs, args.min_val, args.max_val,
+                                         args.workers or None, args.timeout, args.seed, args.cache_dir)
+        execution_results = {name: summary[(name, "random")][args.size] for name in SORTING_ALGORITHMS}
+        if args.sizes:
+            curves = {key: {size: avg for size, (avg, _) in by_size.items()}
+                      for key, by_size in summary.items() if key[1] in args.distributions}
+    else:
+        mapping = None
+        if args.input_file:
+            # No parse step: the file is mapped and sorted copies are made buffer to buffer
+            mapping = binary_io.MappedIntArray(args.input_file, args.typecode)
+            data = mapping.open()
+            print(f"Mapped {len(data)} integers from {args.input_file}.")
+        else:
+            data, generation_time = load_input("random", args.size, args.min_val, args.max_val,
+                                               args.seed, args.cache_dir)
+            print(f"Data generation took {generation_time:.6f} seconds.")
+
+        execution_results = {}
+
+        for name, func in SORTING_ALGORITHMS.items():
+            avg_time, std_time = time_algorithm(func, data, num_runs)
+            execution_results[name] = (avg_time, std_time)
+            print(f"{name} took an average of {avg_time:.6f} seconds (Std Dev: {std_time:.6f}).")
+
+        if mapping is not None:
+            mapping.close()
+            if args.write_sorted:
+                elapsed = binary_io.sort_file(args.input_file, SORTING_ALGORITHMS[args.write_sorted], args.typecode)
+                print(f"Sorted {args.input_file} in place with {args.write_sorted} in {elapsed:.6f} seconds.")
+
+        if args.sizes:
+            print("\nScaling sweep:")
+            curves = run_scaling_sweep(args.sizes, args.distributions, num_runs, args.min_val, args.max_val,
+                                       args.seed, args.cache_dir)
+
+    display_table(execution_results, num_runs)
+
+    if args.select_k:
+        selection_data, _ = load_input("random", args.size, args.min_val, args.max_val, args.seed, args.cache_dir)
+        ks = sorted(k for k in args.select_k if 0 < k <= args.size)
+        display_selection_table(run_selection_comparison(selection_data, ks, num_runs), args.size)
+
+    if args.sample_sort:
+        import sample_sort
+        sample_data, _ = load_input("random", args.size, args.min_val, args.max_val, args.seed, args.cache_dir)
+        result, report = sample_sort.sample_sort(sample_data, SORTING_ALGORITHMS[args.sample_sort],
+                                                 args.sample_sort_workers, seed=args.seed)
+        if result != sorted(sample_data):
+            raise ValueError("Sample Sort returned an unsorted result")
+        sample_sort.print_report(report, args.sample_sort)
+
+    finish_profile(profiler, args.profile)
 
-    execution_results = {}
-    num_runs = 20
-
-    for name, func in sorting_algorithms.items():
-        times = []
-        for _ in range(num_runs):
-            elapsed = measure_sorting_time(func, data)
-            times.append(elapsed)
-        avg_time = statistics.mean(times)
-        std_time = statistics.stdev(times)
-        execution_results[name] = (avg_time, std_time)
-        print(f"{name} took an average of {avg_time:.6f} seconds (Std Dev: {std_time:.6f}).")
-
-    display_table(execution_results)
-
-    # Visualization using matplotlib
-    algorithms = list(execution_results.keys())
-    avg_times = [execution_results[alg][0] for alg in algorithms]
-
-    plt.figure(figsize=(10, 6))
-    plt.bar(algorithms, avg_times, color='skyblue')
-    plt.xlabel("Sorting Algorithms")
-    plt.ylabel("Average Execution Time (seconds)")
-    plt.title("Average Execution Time Comparison (20 Runs)")
-    plt.tight_layout()
-    plt.show()
+    # Visualization (written to files; matplotlib is only imported here)
+    if not args.no_plot:
+        bar_path = os.path.join(args.plot_dir, f"average_times.{args.plot_format}")
+        written = [plotting.save_bar_chart(
+            {name: avg for name, (avg, _) in execution_results.items() if avg is not None}, bar_path,
+            title=f"Average Execution Time Comparison ({num_runs} Runs)",
+            ylabel="Average Execution Time (seconds)")]
+        if curves:
+            written += plotting.save_scaling_curves(curves, args.plot_dir, args.plot_format)
+        for path in written:
+            if path:
+                print(f"Chart written to {path}")
 
     # Analysis and Optimization Recommendations (Output for further analysis)
     print("\nAnalysis and Optimization Recommendations:")
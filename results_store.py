@@ -0,0 +1,59 @@
+"""
+results_store.py
+
+Append-only store for experiment results.
+
+Every run is one JSON object per line (JSON Lines), so unattended sweeps can append from
+several processes or sessions and a partially written sweep is still readable. Each record
+holds the experiment name, its parameters, the result, a UTC timestamp and the host name.
+"""
+
+import datetime
+import json
+import os
+import socket
+
+DEFAULT_RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results", "results.jsonl")
+
+
+class ResultsStore:
+    """JSON Lines file of experiment records."""
+
+    def __init__(self, path=DEFAULT_RESULTS_PATH):
+        self.path = path
+
+    def append(self, experiment, params, result):
+        """
+        Writes one record and returns it.
+        """
+        record = {
+            "experiment": experiment,
+            "params": params,
+            "result": result,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "host": socket.gethostname(),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # One write call per line keeps concurrent appenders from interleaving records
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+        return record
+
+    def load(self, experiment=None):
+        """
+        Returns all records (optionally only those of one experiment), oldest first.
+        """
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if experiment is None or record["experiment"] == experiment:
+                    records.append(record)
+        return records
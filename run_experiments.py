@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+run_experiments.py
+
+Unattended batch driver for the repository's experiments.
+
+The interactive entry points (complexity_experiment.main, the patient records sorting
+prompts and the hash table menu) each ask for their parameters one at a time. This driver
+runs the same experiments over a parameter grid taken from the command line or from a
+JSON, TOML or YAML spec file, and appends every result to the results store
+(results_store.py).
+
+Examples:
+    python run_experiments.py --experiment complexity --param n=1000,10000,100000
+    python run_experiments.py --experiment hash_table --param table_size=10,100 --param user_count=1000
+    python run_experiments.py --experiment hash_benchmark --param read_ratio=0.5,0.9 --param zipf=0,1.2
+    python run_experiments.py --spec overnight.toml
+    python run_experiments.py --spec overnight.toml --profile overnight.collapsed
+
+A spec file lists experiments with a grid of parameter values; every combination is run:
+
+    {
+        "results": "results/overnight.jsonl",
+        "experiments": [
+            {"experiment": "complexity", "grid": {"n": [1000, 10000]}},
+            {"experiment": "patient_sorting", "grid": {"num_records": [1000, 5000], "num_runs": [3]}},
+            {"experiment": "hash_table", "grid": {"table_size": [10, 100], "user_count": [1000]}},
+            {"experiment": "sorting", "grid": {"size": [1000, 10000], "distribution": ["random", "sorted"]}}
+        ]
+    }
+
+Each list in a grid is an axis. Parameters that select several names (complexity's workloads,
+sorting's algorithms, hash_benchmark's tables) take one value as a nested list, e.g.
+{"algorithms": [["Merge Sort", "Intro Sort"], ["Heap Sort"]]} runs two grid points, or on the
+command line as names joined with "+": --param "algorithms=Merge Sort+Intro Sort".
+"""
+
+import argparse
+import inspect
+import itertools
+import json
+import os
+import sys
+
+from algorithms.profile_cli import add_profile_arguments, finish_profile, profiler_from_args, section
+from results_store import DEFAULT_RESULTS_PATH, ResultsStore
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for _folder in ("critical_thinking", "portfolio"):
+    sys.path.insert(0, os.path.join(ROOT, _folder))
+
+
+# -----------------------------
+# Experiment runners
+# -----------------------------
+# Each runner takes one grid point's parameters as keyword arguments and returns a
+# JSON-serializable result. Modules are imported inside the runner so an experiment's
+# dependencies are only loaded when that experiment runs.
+
+def name_list(value):
+    """
+    Reads a parameter that selects registry entries (workloads, algorithms, tables).
+    None selects everything; a string is one name, or several joined with "+" (on the command
+    line commas already separate grid values); a list, written as a nested list in a spec
+    grid, is used as given.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [name.strip() for name in value.split("+")]
+    return list(value)
+
+
+def run_complexity(n, workloads=None):
+    from algorithms import complexity_experiment
+    complexity_experiment.verify_workloads()
+    results = complexity_experiment.run_experiment([n], name_list(workloads))
+    return {name: {variant: timings[n] for variant, timings in variants.items()}
+            for name, variants in results.items()}
+
+
+def run_patient_sorting(num_records, num_runs=1, key="id", cache=False):
+    import patient_records_sorting
+    cache_dir = patient_records_sorting.CACHE_DIR if cache else None
+    return patient_records_sorting.run_sorting_tests(num_records, num_runs, key, cache_dir)
+
+
+def run_hash_table(table_size, user_count, lookups=1000, seed=None):
+    import content_recommendation_hashtable
+    return content_recommendation_hashtable.run_simulation(table_size, user_count, lookups, seed)
+
+
+def run_hash_benchmark(key_space=100_000, ops=1_000_000, read_ratio=0.8, delete_share=0.5, zipf=1.0,
+                       prefill=0.5, buckets=None, tables=None, seed=0, latency=True, memory=True):
+    import hashtable_benchmark
+    return hashtable_benchmark.run_benchmark(key_space, ops, read_ratio, delete_share, zipf, prefill,
+                                             buckets, name_list(tables), seed, latency, memory)
+
+
+def run_sorting(size, distribution="random", runs=5, min_val=1, max_val=10000, seed=0, algorithms=None,
+                sample_sort_workers=None):
+    import smart_sort
+    import sorting_comparator_v2
+    data, generation_time = sorting_comparator_v2.load_input(distribution, size, min_val, max_val, seed)
+    # The input's features are stored with the timings so smart_sort can tune its thresholds on them
+    features = smart_sort.profile_input(data)
+    result = {"generation_seconds": generation_time, "features": features, "algorithms": {}}
+    for name in name_list(algorithms) or sorting_comparator_v2.SORTING_ALGORITHMS:
+        avg_time, std_time = sorting_comparator_v2.time_algorithm(
+            sorting_comparator_v2.SORTING_ALGORITHMS[name], data, runs)
+        result["algorithms"][name] = {"avg": avg_time, "std": std_time}
+    if sample_sort_workers:
+        # Measured alongside the serial engines so smart_sort can tune its parallel threshold
+        import sample_sort
+        import statistics
+        import time
+        times = []
+        for _ in range(runs):
+            # Whole call, pool startup and shutdown included: smart_sort pays them on every call
+            start_time = time.perf_counter()
+            sample_sort.sample_sort(data, sorting_comparator_v2.SORTING_ALGORITHMS["Intro Sort"],
+                                    sample_sort_workers, seed=seed)
+            times.append(time.perf_counter() - start_time)
+        result["algorithms"]["Sample Sort"] = {
+            "avg": statistics.mean(times),
+            "std": statistics.stdev(times) if runs > 1 else 0.0,
+        }
+    return result
+
+
+EXPERIMENTS = {
+    "complexity": run_complexity,
+    "patient_sorting": run_patient_sorting,
+    "hash_table": run_hash_table,
+    "hash_benchmark": run_hash_benchmark,
+    "sorting": run_sorting,
+}
+
+
+def _workload_names():
+    from algorithms import complexity_experiment
+    return complexity_experiment.WORKLOADS
+
+
+def _table_names():
+    import hashtable_benchmark
+    return hashtable_benchmark.TABLES
+
+
+def _algorithm_names():
+    from algorithms import SORTING_ALGORITHMS
+    return SORTING_ALGORITHMS
+
+
+# Parameters read with name_list(), and where their valid names come from
+NAME_PARAMS = {
+    ("complexity", "workloads"): _workload_names,
+    ("hash_benchmark", "tables"): _table_names,
+    ("sorting", "algorithms"): _algorithm_names,
+}
+
+
+# -----------------------------
+# Spec handling
+# -----------------------------
+
+def load_spec(path):
+    """
+    Reads a JSON, TOML or YAML spec file (chosen by extension).
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    if extension == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            sys.exit("TOML specs need Python 3.11+ (tomllib); use a JSON spec instead.")
+        with open(path, "rb") as file:
+            return tomllib.load(file)
+    if extension in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            sys.exit("YAML specs need PyYAML (pip install pyyaml); use a JSON or TOML spec instead.")
+        with open(path, encoding="utf-8") as file:
+            return yaml.safe_load(file)
+    sys.exit(f"Unknown spec format '{extension}', expected .json, .toml, .yaml or .yml")
+
+
+def expand_grid(grid):
+    """
+    Yields one parameter dict per combination of the grid's value lists
+    (a scalar value is treated as a one-element list).
+    """
+    names = list(grid)
+    value_lists = [grid[name] if isinstance(grid[name], list) else [grid[name]] for name in names]
+    for combination in itertools.product(*value_lists):
+        yield dict(zip(names, combination))
+
+
+def parse_param(text):
+    """
+    Parses a --param argument of the form name=value1,value2,... into (name, [values]).
+    Values are read as JSON where possible (numbers, true/false, null) and as strings otherwise.
+    """
+    name, separator, values = text.partition("=")
+    if not separator or not name:
+        raise argparse.ArgumentTypeError(f"expected name=value[,value...], got '{text}'")
+    parsed = []
+    for value in values.split(","):
+        try:
+            parsed.append(json.loads(value))
+        except json.JSONDecodeError:
+            parsed.append(value)
+    return name, parsed
+
+
+def validate_plan(plan):
+    """
+    Checks every experiment name, every grid point's params against its runner's signature
+    and every name in a NAME_PARAMS parameter, so a typo late in a spec is caught before the
+    sweep starts.
+
+    Returns:
+        list: One message per problem (empty when the plan is valid).
+    """
+    errors = []
+    for index, entry in enumerate(plan, 1):
+        name = entry.get("experiment")
+        if name not in EXPERIMENTS:
+            errors.append(f"entry {index}: unknown experiment '{name}', expected one of {sorted(EXPERIMENTS)}")
+            continue
+        signature = inspect.signature(EXPERIMENTS[name])
+        for params in expand_grid(entry.get("grid", {})):
+            try:
+                signature.bind(**params)
+            except TypeError as error:
+                errors.append(f"entry {index} ({name} {params}): {error}")
+                continue
+            for param, value in params.items():
+                if (name, param) not in NAME_PARAMS or value is None:
+                    continue
+                if not isinstance(value, (str, list)):
+                    errors.append(f"entry {index} ({name} {params}): {param} must be a name or a list of names")
+                    continue
+                unknown = [item for item in name_list(value) if item not in NAME_PARAMS[name, param]()]
+                if unknown:
+                    errors.append(f"entry {index} ({name} {params}): unknown {param} {unknown}, "
+                                  f"expected names from {sorted(NAME_PARAMS[name, param]())}")
+    return errors
+
+
+def run_plan(plan, store, profiler=None):
+    """
+    Runs every grid point of every experiment in the plan and stores the results.
+    The whole plan is validated first; nothing runs if any entry is invalid.
+    With a profiler, each grid point's samples are labelled with the experiment and its params.
+
+    Returns:
+        int: Number of grid points that failed.
+    """
+    errors = validate_plan(plan)
+    if errors:
+        sys.exit("Invalid experiment plan:\n  " + "\n  ".join(errors))
+    failures = 0
+    for entry in plan:
+        name = entry["experiment"]
+        for params in expand_grid(entry.get("grid", {})):
+            print(f"\n=== {name} {params} ===")
+            try:
+                with section(profiler, f"{name} {json.dumps(params, sort_keys=True)}"):
+                    result = EXPERIMENTS[name](**params)
+            except Exception as error:
+                # Keep the sweep going; the failure is recorded alongside the results
+                failures += 1
+                print(f"  failed: {error!r}")
+                store.append(name, params, {"error": repr(error)})
+                continue
+            store.append(name, params, result)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run experiments unattended over parameter grids")
+    parser.add_argument("--spec", help="JSON, TOML or YAML file listing experiments and their grids")
+    parser.add_argument("--experiment", choices=sorted(EXPERIMENTS), help="Single experiment to run")
+    parser.add_argument("--param", type=parse_param, action="append", default=[],
+                        help="Grid values for --experiment, as name=value1,value2 (repeatable)")
+    parser.add_argument("--results", help=f"Results store file (default: {DEFAULT_RESULTS_PATH})")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if bool(args.spec) == bool(args.experiment):
+        parser.error("give exactly one of --spec or --experiment")
+
+    if args.spec:
+        spec = load_spec(args.spec)
+        plan = spec.get("experiments", [])
+        results_path = args.results or spec.get("results") or DEFAULT_RESULTS_PATH
+    else:
+        plan = [{"experiment": args.experiment, "grid": dict(args.param)}]
+        results_path = args.results or DEFAULT_RESULTS_PATH
+
+    store = ResultsStore(results_path)
+    profiler = profiler_from_args(args)
+    failures = run_plan(plan, store, profiler)
+    finish_profile(profiler, args.profile)
+    print(f"\nResults appended to {results_path}" + (f" ({failures} failed)" if failures else ""))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()